@@ -0,0 +1,591 @@
+import argparse
+import ctypes
+import gc
+import itertools
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEvent, Qt, qVersion
+from PySide6.QtGui import QColor, QImage
+from PySide6.QtWidgets import QApplication, QListWidgetItem
+
+from journal_generator import write_journal
+from main_window import MainWindow
+from widgets import LifeWeeksWidget
+
+
+HEATMAP_TONES = ["#c6e9cf", "#8fd3a1", "#40c463", "#339c4f", "#26753b"]
+DEFAULT_SIZES = "1000,10000,100000,1000000"
+MEMORY_SIZES = "1000,10000,100000"
+DEFAULTS = {"suite": "all", "sizes": DEFAULT_SIZES, "repeat": 20, "years": 120, "rounds": 1}
+TRIM_FRACTION = 0.2
+ROW_SAMPLE = 1000
+ROW_REPEATS = 5
+GATE_METRICS = r"^((load|save|week_select|solo_refresh)_\d+|paint_(months|weeks|life)_full)$"
+STATISTICS = ("median_ms", "trimmed_ms", "min_ms")
+
+
+def trimmed_mean(samples):
+    ordered = sorted(samples)
+    trim = int(len(ordered) * TRIM_FRACTION)
+    kept = ordered[trim : len(ordered) - trim] or ordered
+    return statistics.fmean(kept)
+
+
+def measure(callback, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        callback()
+        samples.append(time.perf_counter() - start)
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 3),
+        "trimmed_ms": round(trimmed_mean(samples) * 1000, 3),
+        "min_ms": round(min(samples) * 1000, 3),
+        "runs": len(samples),
+    }
+
+
+def measure_refreshes(window, callback, repeat):
+    before = Counter(window.refresh_counters)
+    result = measure(callback, repeat)
+    done = Counter(window.refresh_counters)
+    done.subtract(before)
+    result["refreshes_per_run"] = {
+        part: round(count / result["runs"], 2)
+        for part, count in sorted(done.items())
+        if count > 0
+    }
+    return result
+
+
+def merge_rounds(rounds):
+    merged = {}
+    for name in rounds[0]:
+        stats = [results[name] for results in rounds if name in results]
+        merged[name] = {
+            field: min(stat[field] for stat in stats)
+            for field in STATISTICS
+        }
+        fastest = [stat["min_ms"] for stat in stats]
+        merged[name]["spread"] = (
+            round(max(fastest) / min(fastest), 3) if min(fastest) > 0 else 1.0
+        )
+        merged[name]["runs"] = sum(stat["runs"] for stat in stats)
+        merged[name]["rounds"] = len(stats)
+        refreshes = [
+            stat["refreshes_per_run"] for stat in stats if "refreshes_per_run" in stat
+        ]
+        if refreshes:
+            merged[name]["refreshes_per_run"] = {
+                part: max(counts.get(part, 0) for counts in refreshes)
+                for part in sorted(set().union(*refreshes))
+            }
+    return merged
+
+
+def build_heatmap_widget(view_mode, years):
+    widget = LifeWeeksWidget()
+    widget.set_years(years)
+    widget.set_view_mode(view_mode)
+    widget.set_entries_mode(True)
+    widget.set_heatmap_colors([QColor(tone) for tone in HEATMAP_TONES])
+    total_weeks = years * widget.weeks_per_year
+    widget.set_week_counts(
+        {index: index % 5 for index in range(0, total_weeks, 2)}
+    )
+    if view_mode == "life":
+        start_day = widget.birth_date.toJulianDay()
+        total_days = widget.birth_date.daysTo(widget.today) + 1
+    else:
+        start_day = widget.daily_start_date().toJulianDay()
+        total_days = widget.day_cols * widget.day_rows
+    widget.set_day_counts(
+        {start_day + index: index % 5 for index in range(0, total_days, 2)}
+    )
+    widget.resize(widget.sizeHint())
+    return widget
+
+
+def paint_benchmark(repeat, years):
+    results = {}
+    for view_mode in ("years", "months", "weeks", "days", "life"):
+        widget = build_heatmap_widget(view_mode, years)
+        ratio = widget.devicePixelRatioF()
+        image = QImage(
+            widget.width() * ratio,
+            widget.height() * ratio,
+            QImage.Format_ARGB32_Premultiplied,
+        )
+        image.setDevicePixelRatio(ratio)
+
+        def full_repaint():
+            widget.invalidate_grid_cache()
+            widget.invalidate_life_image()
+            widget.render(image)
+
+        def cached_repaint():
+            widget.render(image)
+
+        results[f"paint_{view_mode}_full"] = measure(full_repaint, repeat)
+        results[f"paint_{view_mode}_cached"] = measure(cached_repaint, repeat)
+    return results
+
+
+def runs_for_size(repeat, size):
+    return max(1, min(repeat, 100000 // size))
+
+
+def release_window(window):
+    window.close()
+    QApplication.processEvents()
+    window.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    gc.collect()
+
+
+def journal_benchmark(size, repeat, workdir):
+    path = os.path.join(workdir, f"journal_{size}.json")
+    write_journal(path, size)
+    runs = runs_for_size(repeat, size)
+    results = {}
+    window = MainWindow()
+    window.data_path = path
+    window.background_rows_threshold = size + 1
+    results[f"load_{size}"] = measure(window.load_data, runs)
+    results[f"save_{size}"] = measure(window.save_data, runs)
+
+    window.view_combo.setCurrentIndex(1)
+    window.flush_refresh()
+    busiest = sorted(
+        window.week_notes, key=lambda week: len(window.week_notes[week]), reverse=True
+    )
+    weeks = itertools.cycle(busiest[: window.display_rows_cache_size * 4] or [0])
+
+    def select_week():
+        window.on_week_selected(next(weeks))
+        window.flush_refresh()
+
+    results[f"week_select_{size}"] = measure_refreshes(
+        window, select_week, max(runs, 10)
+    )
+
+    widget = window.life_widget
+    widget.resize(widget.sizeHint())
+    ratio = widget.devicePixelRatioF()
+    image = QImage(
+        widget.width() * ratio,
+        widget.height() * ratio,
+        QImage.Format_ARGB32_Premultiplied,
+    )
+    image.setDevicePixelRatio(ratio)
+
+    def heatmap_paint():
+        widget.invalidate_grid_cache()
+        widget.render(image)
+
+    results[f"heatmap_counts_{size}"] = measure(window.update_counts, runs)
+    results[f"heatmap_paint_{size}"] = measure(heatmap_paint, runs)
+
+    window.tabs.setCurrentIndex(1)
+    window.flush_refresh()
+
+    def solo_refresh():
+        window.display_rows_cache.clear()
+        window.invalidate(entries_list=True)
+        window.flush_refresh()
+
+    results[f"solo_refresh_{size}"] = measure_refreshes(window, solo_refresh, runs)
+
+    window.view_combo.setCurrentIndex(2)
+    window.flush_refresh()
+    tags = itertools.cycle([None] + [tag for tag, _ in window.work_tag_options])
+
+    def filter_toggle():
+        window.display_rows_cache.clear()
+        window.set_filter_tag(next(tags))
+        window.flush_refresh()
+
+    results[f"filter_toggle_{size}"] = measure_refreshes(window, filter_toggle, runs)
+    release_window(window)
+    return results
+
+
+def traced_bytes():
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def resident_bytes():
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def release_heap():
+    gc.collect()
+    try:
+        ctypes.CDLL(None).malloc_trim(0)
+    except (AttributeError, OSError, TypeError):
+        pass
+
+
+def traced_call(callback):
+    before = traced_bytes()
+    tracemalloc.reset_peak()
+    callback()
+    peak = tracemalloc.get_traced_memory()[1]
+    return traced_bytes() - before, peak - before
+
+
+def per_item(total, count):
+    return round(total / count, 1) if count and total is not None else None
+
+
+def deep_size(root):
+    seen = set()
+    pending = [root]
+    total = 0
+    while pending:
+        value = pending.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        total += sys.getsizeof(value)
+        if isinstance(value, dict):
+            pending.extend(value.keys())
+            pending.extend(value.values())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            pending.extend(value)
+    return total
+
+
+def notes_footprint(window):
+    report = {}
+    for name in ("week_notes", "work_notes"):
+        notes = getattr(window, name)
+        count = sum(len(entries) for entries in notes.values())
+        report[f"{name}_entries"] = count
+        report[f"{name}_bytes_per_entry"] = per_item(deep_size(notes), count)
+    report["preview_cache_entries"] = len(window.preview_cache)
+    report["preview_cache_bytes_per_entry"] = per_item(
+        deep_size(window.preview_cache), len(window.preview_cache)
+    )
+    return report
+
+
+def add_rows(window, specs):
+    for spec in specs:
+        item = QListWidgetItem()
+        item.setData(Qt.UserRole, spec[1])
+        window.notes_list.addItem(item)
+        window.set_note_item_widget(item, spec[2])
+
+
+def rows_footprint(window, prefix):
+    shown = list(window.display_specs)
+    source = [spec for spec in shown if not isinstance(spec[2], int)]
+    if not source:
+        return {f"{prefix}_rows": 0}
+    sample = list(itertools.islice(itertools.cycle(source), ROW_SAMPLE))
+    window.apply_display_rows([])
+    QApplication.processEvents()
+    release_heap()
+    traced = []
+    resident = []
+    for _ in range(ROW_REPEATS):
+        before_resident = resident_bytes()
+        retained, _ = traced_call(lambda: add_rows(window, sample))
+        QApplication.processEvents()
+        after_resident = resident_bytes()
+        traced.append(retained)
+        if before_resident is not None and after_resident is not None:
+            resident.append(after_resident - before_resident)
+    window.notes_list.clear()
+    QApplication.processEvents()
+    window.apply_display_rows(shown)
+    native = statistics.fmean(max(0, delta) for delta in resident) if resident else None
+    return {
+        f"{prefix}_rows": len(sample),
+        f"{prefix}_repeats": ROW_REPEATS,
+        f"{prefix}_bytes_per_row": per_item(statistics.fmean(traced), len(sample)),
+        f"{prefix}_resident_bytes_per_row": per_item(native, len(sample)),
+        f"{prefix}_resident_negative_samples": sum(delta < 0 for delta in resident),
+    }
+
+
+def memory_report(size, workdir):
+    path = os.path.join(workdir, f"journal_{size}.json")
+    write_journal(path, size)
+    window = MainWindow()
+    window.data_path = path
+    window.background_rows_threshold = size + 1
+    tracemalloc.start()
+    try:
+        report = {"entries": size}
+        retained, peak = traced_call(window.load_data)
+        report["load_retained_bytes"] = retained
+        report["load_peak_bytes"] = peak
+        report["load_bytes_per_entry"] = per_item(retained, size)
+        report.update(notes_footprint(window))
+
+        window.tabs.setCurrentIndex(0)
+        busiest = max(
+            window.week_notes, key=lambda week: len(window.week_notes[week]), default=0
+        )
+        window.on_week_selected(busiest)
+        window.flush_refresh()
+        report.update(rows_footprint(window, "calendar"))
+        window.tabs.setCurrentIndex(1)
+        window.flush_refresh()
+        report.update(rows_footprint(window, "solo"))
+
+        _, peak = traced_call(window.save_data)
+        report["save_peak_bytes"] = peak
+    finally:
+        tracemalloc.stop()
+        release_window(window)
+    return report
+
+
+def machine_info(app):
+    return {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "qt": qVersion(),
+        "platform": app.platformName(),
+    }
+
+
+def machine_mismatch(baseline, machine):
+    recorded = baseline.get("machine", {})
+    return sorted(
+        name for name in machine if recorded.get(name) != machine[name]
+    )
+
+
+def run_suite(config):
+    results = {}
+    if config["suite"] in ("all", "paint"):
+        results.update(paint_benchmark(config["repeat"], config["years"]))
+    if config["suite"] in ("all", "journal"):
+        workdir = tempfile.mkdtemp(prefix="bitacora-bench-")
+        try:
+            for size in config["sizes"]:
+                results.update(journal_benchmark(size, config["repeat"], workdir))
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def compare_results(results, baseline, statistic, tolerance, min_delta_ms, metrics):
+    pattern = re.compile(metrics)
+    rows = []
+    for name in sorted(baseline):
+        if not pattern.search(name):
+            continue
+        if name not in results:
+            rows.append({"metric": name, "status": "missing"})
+            continue
+        before = baseline[name].get(statistic, baseline[name]["median_ms"])
+        after = results[name][statistic]
+        ratio = after / before if before > 0 else 1.0
+        spread = max(
+            baseline[name].get("spread", 1.0), results[name].get("spread", 1.0)
+        )
+        allowed = max(tolerance, spread - 1)
+        regressed = after > before * (1 + allowed) and after - before > min_delta_ms
+        rows.append(
+            {
+                "metric": name,
+                "baseline_ms": before,
+                "current_ms": after,
+                "ratio": round(ratio, 3),
+                "tolerance": round(allowed, 3),
+                "status": "regression" if regressed else "ok",
+            }
+        )
+    return rows
+
+
+def print_comparison(rows, statistic, tolerance):
+    print(
+        f"Comparacion ({statistic}, tolerancia minima {tolerance:.0%}):",
+        file=sys.stderr,
+    )
+    for row in rows:
+        if row["status"] == "missing":
+            print(f"  {row['metric']:<28} sin medicion", file=sys.stderr)
+            continue
+        print(
+            f"  {row['metric']:<28} {row['baseline_ms']:>10.3f} -> "
+            f"{row['current_ms']:>10.3f} ms  x{row['ratio']:<6} "
+            f"(+{row['tolerance']:.0%}) {row['status']}",
+            file=sys.stderr,
+        )
+
+
+def memory_main(args):
+    sizes = [
+        int(value)
+        for value in (args.sizes or MEMORY_SIZES).split(",")
+        if value.strip()
+    ]
+    app = QApplication.instance() or QApplication([])
+    workdir = tempfile.mkdtemp(prefix="bitacora-memory-")
+    try:
+        memory = {str(size): memory_report(size, workdir) for size in sizes}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    text = json.dumps(
+        {"platform": app.platformName(), "sizes": sizes, "memory": memory},
+        indent=2,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    print(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bitacora performance benchmarks")
+    parser.add_argument("--repeat", type=int)
+    parser.add_argument("--years", type=int)
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        help="run the whole suite this many times and keep the minimum per metric",
+    )
+    parser.add_argument("--output", help="write the JSON report to this path")
+    parser.add_argument("--suite", choices=("all", "paint", "journal"))
+    parser.add_argument(
+        "--sizes",
+        help="comma separated journal sizes for the journal suite",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="report the memory footprint per entry and per row instead of timings",
+    )
+    parser.add_argument(
+        "--baseline",
+        help="compare against this report and exit with 1 on regressions",
+    )
+    parser.add_argument("--write-baseline", help="write the report as a baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown; widened per metric to the spread between rounds",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=0.5,
+        help="ignore regressions smaller than this absolute difference",
+    )
+    parser.add_argument("--statistic", choices=STATISTICS, default="min_ms")
+    parser.add_argument(
+        "--metrics",
+        default=GATE_METRICS,
+        help="regular expression selecting the metrics compared to the baseline",
+    )
+    parser.add_argument(
+        "--confirm",
+        type=int,
+        default=1,
+        help="re-run the suite this many times to confirm regressions",
+    )
+    args = parser.parse_args()
+
+    if args.memory:
+        memory_main(args)
+        return
+
+    baseline = None
+    config = dict(DEFAULTS)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        config.update(baseline.get("config", {}))
+    for name in DEFAULTS:
+        value = getattr(args, name)
+        if value is not None:
+            config[name] = value
+    if isinstance(config["sizes"], str):
+        config["sizes"] = [
+            int(value) for value in config["sizes"].split(",") if value.strip()
+        ]
+    if config["suite"] == "paint":
+        config["sizes"] = []
+
+    app = QApplication.instance() or QApplication([])
+    rounds = [run_suite(config) for _ in range(max(1, config["rounds"]))]
+    results = rounds[0] if len(rounds) == 1 else merge_rounds(rounds)
+    report = {
+        "platform": app.platformName(),
+        "device_pixel_ratio": app.devicePixelRatio(),
+        "machine": machine_info(app),
+        "sizes": config["sizes"],
+        "config": config,
+        "results": results,
+    }
+    comparison = None
+    if baseline is not None:
+        for attempt in range(max(0, args.confirm) + 1):
+            if attempt:
+                print("Posible regresion; repitiendo para confirmar", file=sys.stderr)
+                rounds.extend(
+                    run_suite(config) for _ in range(max(1, config["rounds"]))
+                )
+                results = merge_rounds(rounds)
+                report["results"] = results
+            comparison = compare_results(
+                results,
+                baseline["results"],
+                args.statistic,
+                args.tolerance,
+                args.min_delta_ms,
+                args.metrics,
+            )
+            if not any(row["status"] == "regression" for row in comparison):
+                break
+        report["comparison"] = comparison
+    text = json.dumps(report, indent=2)
+    for path in (args.output, args.write_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(text + "\n")
+    print(text)
+    if comparison is not None:
+        mismatch = machine_mismatch(baseline, report["machine"])
+        if mismatch:
+            print(
+                "Aviso: la linea base se grabo en otra maquina "
+                f"({', '.join(mismatch)} difieren); "
+                "vuelve a grabarla aqui con --write-baseline",
+                file=sys.stderr,
+            )
+        print_comparison(comparison, args.statistic, args.tolerance)
+        if any(row["status"] != "ok" for row in comparison):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
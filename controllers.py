@@ -1,10 +1,22 @@
-from PySide6.QtCore import QDate, Qt
-from PySide6.QtGui import QColor
-from PySide6.QtWidgets import QListWidgetItem, QSizePolicy
+from collections import Counter
+from difflib import SequenceMatcher
 
+from PySide6.QtCore import QDate, Qt, QTimer
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QLabel,
+    QListWidgetItem,
+    QSizePolicy,
+)
+
+from display_rows import compute_display_rows
 from widgets import NoteItemWidget
 
 
+EARLIER_ROWS_KEY = "earlier"
+
+
 class ViewControllerMixin:
     def on_view_changed(self, index):
         if self.is_solo_view() and index == 0:
@@ -14,7 +26,8 @@ class ViewControllerMixin:
             index = 1
         entries_mode = index in (1, 2)
         solo_mode = self.is_solo_view()
-        self.current_entry = None
+        self.current_entry_id = None
+        self.display_window = (0, 0)
         self.notes_panel.setVisible(True)
         self.life_widget.set_entries_mode(entries_mode)
         self.heatmap_label.setVisible(entries_mode and not solo_mode)
@@ -25,11 +38,10 @@ class ViewControllerMixin:
         self.main_color_combo.setVisible(not entries_mode)
         if entries_mode:
             self.sync_heatmap_combo()
-            self.update_heatmap_colors()
-            self.update_counts()
+            self.invalidate(counts=True, heatmap=True)
             if self.is_solo_view():
                 self.week_label.setText("Bitacora completa")
-                self.refresh_entries_list()
+                self.invalidate(entries_list=True)
             else:
                 self.on_week_selected(self.life_widget.selected_week)
         else:
@@ -77,7 +89,8 @@ class ViewControllerMixin:
 
     def on_birth_changed(self, date_value):
         self.life_widget.set_birth_date(date_value)
-        self.refresh_entries_list()
+        self.mark_data_changed()
+        self.invalidate(entries_list=True)
         if self.life_widget.selected_week is not None:
             self.on_week_selected(self.life_widget.selected_week)
         if not self.loading:
@@ -86,7 +99,7 @@ class ViewControllerMixin:
     def on_years_changed(self, years_value):
         self.life_widget.set_years(years_value)
         self.update_scroll_width()
-        self.refresh_entries_list()
+        self.invalidate(entries_list=True)
         if self.life_widget.selected_week is not None:
             self.on_week_selected(self.life_widget.selected_week)
         if not self.loading:
@@ -96,7 +109,7 @@ class ViewControllerMixin:
         if week_index is None:
             return "Semana seleccionada: -"
         if (
-            self.life_widget.view_mode == "days"
+            self.life_widget.is_daily_mode()
             and self.life_widget.selected_date is not None
             and self.life_widget.selected_date.isValid()
         ):
@@ -110,50 +123,90 @@ class ViewControllerMixin:
     def on_week_selected(self, week_index):
         if week_index is None:
             return
+        key_step = self.life_widget.take_key_week_step()
+        if key_step is not None:
+            self.last_week_step = key_step
+        elif self.current_week is not None and week_index != self.current_week:
+            self.last_week_step = 1 if week_index > self.current_week else -1
         self.current_week = week_index
         self.week_label.setText(self.week_label_text(week_index))
-        self.refresh_entries_list()
+        self.invalidate(entries_list=True)
         entries = self.entries_for_week(week_index)
         if entries:
-            if self.current_entry is None or self.current_entry >= len(entries):
-                self.select_entry_item(0, week_index)
+            found = self.find_entry_by_id(self.current_entry_id)
+            if found is None or found[0] != week_index:
+                self.request_selection(entries[0].get("id"))
             else:
-                self.select_entry_item(self.current_entry, week_index)
+                self.request_selection(self.current_entry_id)
         else:
-            self.select_entry_item(None, week_index)
+            self.request_selection(None)
+        QTimer.singleShot(0, self.prefetch_adjacent_weeks)
 
-    def update_week_counts(self):
+    def prefetch_adjacent_weeks(self):
+        if self.is_solo_view() or self.current_week is None:
+            return
+        step = self.last_week_step
+        max_week = self.life_widget.years * self.life_widget.weeks_per_year
+        candidates = []
+        for offset in (step, 2 * step, 1, -1, 52, -52):
+            week_index = self.current_week + offset
+            if 0 <= week_index < max_week and week_index not in candidates:
+                candidates.append(week_index)
+        for week_index in candidates[: self.prefetch_week_count]:
+            self.cached_display_rows(week_index)
+
+    def count_weeks(self):
         counts = {}
         for week_index, entries in self.current_notes().items():
             if isinstance(entries, list):
                 counts[week_index] = len(entries)
-        self.life_widget.set_week_counts(counts)
-
-    def update_day_counts(self):
+        return counts
+
+    def count_days(self):
+        dates = Counter(
+            str(entry.get("date", "")).strip()
+            for entries in self.current_notes().values()
+            if isinstance(entries, list)
+            for entry in entries
+            if isinstance(entry, dict)
+        )
         counts = {}
-        for entries in self.current_notes().values():
-            if not isinstance(entries, list):
+        for date_text, count in dates.items():
+            date_value = QDate.fromString(date_text, "yyyy-MM-dd")
+            if not date_value.isValid():
                 continue
-            for entry in entries:
-                if not isinstance(entry, dict):
-                    continue
-                date_text = str(entry.get("date", "")).strip()
-                date_value = QDate.fromString(date_text, "yyyy-MM-dd")
-                if not date_value.isValid():
-                    continue
-                key = date_value.toString("yyyy-MM-dd")
-                counts[key] = counts.get(key, 0) + 1
-        self.life_widget.set_day_counts(counts)
+            julian_day = date_value.toJulianDay()
+            counts[julian_day] = counts.get(julian_day, 0) + count
+        return counts
+
+    def on_journal_list_event(self, view, *details):
+        self.mark_data_changed(view)
+        if view == self.current_view():
+            self.invalidate(entries_list=True)
+
+    def on_journal_counts_event(self, view, entry_id, fields=None):
+        if fields is not None and "date" not in fields:
+            return
+        self.counts_cache.pop(view, None)
+        if view == self.current_view():
+            self.invalidate(counts=True)
 
     def update_counts(self):
-        self.update_week_counts()
-        self.update_day_counts()
+        self.count_refresh("counts")
+        view = self.current_view()
+        counts = self.counts_cache.get(view)
+        if counts is None:
+            counts = (self.count_weeks(), self.count_days())
+            self.counts_cache[view] = counts
+        self.life_widget.set_week_counts(counts[0])
+        self.life_widget.set_day_counts(counts[1])
 
     def update_main_color(self):
         color_value = self.main_color_combo.currentData() or "#3b7c7a"
         self.life_widget.set_main_color(color_value)
 
     def update_heatmap_colors(self):
+        self.count_refresh("heatmap")
         view = self.current_view()
         stored = self.heatmap_colors_by_view.get(view, "#3b7c7a")
         selected = self.heatmap_combo.currentData() or stored
@@ -206,7 +259,7 @@ class ViewControllerMixin:
             return
         self.filter_tag = emoji
         self.update_filter_buttons()
-        self.refresh_entries_list()
+        self.invalidate(entries_list=True)
 
     def update_filter_buttons(self):
         for button, tag in self.filter_tag_buttons:
@@ -220,18 +273,18 @@ class ViewControllerMixin:
         rows = self.filtered_rows()
         children_map, _, _, _ = self.build_children_map(rows)
         self.collapsed_parents = set(children_map.keys())
-        self.refresh_entries_list()
+        self.invalidate(entries_list=True)
 
     def expand_all(self):
         self.collapsed_parents = set()
-        self.refresh_entries_list()
+        self.invalidate(entries_list=True)
 
     def toggle_parent_collapse(self, entry_id):
         if entry_id in self.collapsed_parents:
             self.collapsed_parents.remove(entry_id)
         else:
             self.collapsed_parents.add(entry_id)
-        self.refresh_entries_list()
+        self.invalidate(entries_list=True)
 
     def build_heatmap_colors(self, base_color):
         h, s, l, a = base_color.getHsl()
@@ -265,13 +318,26 @@ class ViewControllerMixin:
         self.scroll.setFixedWidth(widget_width + scrollbar_width + 6)
 
     def toggle_heatmap_mode(self):
-        self.view_mode = "days" if self.view_mode == "weeks" else "weeks"
-        self.life_widget.set_view_mode(self.view_mode)
-        self.mode_button.setText("Semanas" if self.view_mode == "days" else "Dias")
+        modes = ["weeks", "days", "life"]
+        if self.view_mode in modes:
+            mode = modes[(modes.index(self.view_mode) + 1) % len(modes)]
+        else:
+            mode = "weeks"
+        self.life_widget.set_view_mode(mode)
+        self.on_heatmap_mode_changed(mode)
+
+    def on_heatmap_mode_changed(self, mode):
+        self.view_mode = mode
+        next_labels = {"weeks": "Dias", "days": "Vida", "life": "Semanas"}
+        self.mode_button.setText(next_labels.get(mode, "Semanas"))
         self.update_scroll_width()
-        self.update_counts()
+        self.invalidate(counts=True)
         if self.life_widget.entries_mode:
             self.on_week_selected(self.life_widget.selected_week)
+        selected_rect = self.life_widget.selection_rect()
+        if selected_rect is not None:
+            center = selected_rect.center()
+            self.scroll.ensureVisible(center.x(), center.y())
 
 
 class EntryControllerMixin:
@@ -296,12 +362,12 @@ class EntryControllerMixin:
             "action": False,
             "links": [],
         }
-        self.ensure_entry_id(entry)
+        entry_id = self.ensure_entry_id(entry)
         entries.append(entry)
-        self.refresh_entries_list()
-        self.update_counts()
-        self.select_entry_item(len(entries) - 1, self.current_week)
-        self.save_data()
+        self.invalidate_entry_locations()
+        self.touch_entry(entry, self.current_week)
+        self.journal_events.entry_added.emit(self.current_view(), entry_id)
+        self.request_selection(entry_id)
 
     def save_entry(self):
         if self.current_week is None:
@@ -312,32 +378,34 @@ class EntryControllerMixin:
             self.current_week = selected
         title = self.title_input.text().strip() or "Entrada"
         description = self.desc_edit.toPlainText().strip()
-        entries = self.current_notes().setdefault(self.current_week, [])
-        if self.current_entry is None:
+        if self.current_entry_id is None:
+            entries = self.current_notes().setdefault(self.current_week, [])
             entry_date = self.selected_entry_date()
             entry_time = self.current_time_text()
-            entries.append(
-                {
-                    "title": title,
-                    "description": description,
-                    "date": entry_date,
-                    "time": entry_time,
-                    "action": False,
-                    "links": [],
-                }
-            )
-            self.current_entry = len(entries) - 1
-            self.ensure_entry_id(entries[self.current_entry])
+            entry = {
+                "title": title,
+                "description": description,
+                "date": entry_date,
+                "time": entry_time,
+                "action": False,
+                "links": [],
+            }
+            entry_id = self.ensure_entry_id(entry)
+            entries.append(entry)
+            self.invalidate_entry_locations()
+            self.touch_entry(entry, self.current_week)
+            self.journal_events.entry_added.emit(self.current_view(), entry_id)
         else:
-            if self.current_entry < 0 or self.current_entry >= len(entries):
+            found = self.find_entry_by_id(self.current_entry_id)
+            if found is None:
                 return
-            existing = entries[self.current_entry]
-            entry_date = existing.get("date") or self.week_entry_date(self.current_week)
+            week_index, entry_index, existing = found
+            entry_date = existing.get("date") or self.week_entry_date(week_index)
             entry_time = existing.get("time") or self.current_time_text()
             entry_links = self.clean_links(existing.get("links"))
             entry_id = existing.get("id")
             is_action = bool(existing.get("action")) or self.is_action_entry(existing)
-            entries[self.current_entry] = {
+            entry = {
                 "id": entry_id,
                 "title": title,
                 "description": description,
@@ -346,314 +414,366 @@ class EntryControllerMixin:
                 "action": is_action,
                 "links": entry_links,
             }
-            self.ensure_entry_id(entries[self.current_entry])
-        self.refresh_entries_list()
-        self.update_counts()
-        self.select_entry_item(self.current_entry, self.current_week)
-        self.save_data()
+            fields = frozenset(
+                field for field, value in entry.items() if existing.get(field) != value
+            )
+            if fields:
+                self.current_notes()[week_index][entry_index] = entry
+                self.touch_entry(entry, week_index)
+                self.journal_events.entry_changed.emit(
+                    self.current_view(), entry_id, fields
+                )
+        self.request_selection(entry_id)
 
     def delete_entry(self):
-        if self.current_week is None or self.current_entry is None:
+        found = self.find_entry_by_id(self.current_entry_id)
+        if found is None:
             return
-        entries = self.entries_for_week(self.current_week)
-        if 0 <= self.current_entry < len(entries):
-            removed = entries.pop(self.current_entry)
-            removed_id = removed.get("id") if isinstance(removed, dict) else None
-            self.remove_links_to(removed_id)
+        week_index, entry_index, _ = found
+        entry_id = self.current_entry_id
+        entries = self.entries_for_week(week_index)
+        entries.pop(entry_index)
+        linked_ids = self.remove_links_to(entry_id)
+        self.invalidate_entry_locations()
+        next_entry_id = None
         if not entries:
-            self.current_notes().pop(self.current_week, None)
-            self.current_entry = None
+            self.current_notes().pop(week_index, None)
         else:
-            self.current_entry = max(0, self.current_entry - 1)
-        self.refresh_entries_list()
-        self.update_counts()
-        self.select_entry_item(self.current_entry, self.current_week)
-        self.save_data()
+            next_entry_id = entries[max(0, entry_index - 1)].get("id")
+        view = self.current_view()
+        if linked_ids:
+            self.journal_events.links_changed.emit(view, linked_ids)
+        self.journal_events.entry_removed.emit(view, entry_id)
+        self.request_selection(next_entry_id)
 
     def refresh_entries_list(self):
-        self.notes_list.blockSignals(True)
-        self.notes_list.clear()
+        self.count_refresh("list")
         if self.current_week is None and not self.is_solo_view():
+            self.all_display_specs = []
+            self.row_by_entry_id = {}
+            self.display_window = (0, 0)
+            self.set_rows_pending(False)
+            self.apply_display_rows([])
             self.clear_entry_form()
-            self.notes_list.blockSignals(False)
             return
-        rows = self.filtered_rows()
-        children_map, child_ids, id_to_row, entries_by_id = self.build_children_map(rows)
-
-        subtree_cache = {}
-
-        def subtree_max_date(entry_id):
-            cached = subtree_cache.get(entry_id)
-            if cached is not None:
-                return cached
-            row = id_to_row.get(entry_id)
-            if not row:
-                return 0
-            max_value = self.entry_date_key(row)
-            for child in children_map.get(entry_id, []):
-                child_id = child[2].get("id")
-                if child_id is not None:
-                    max_value = max(max_value, subtree_max_date(child_id))
-                else:
-                    max_value = max(max_value, self.entry_date_key(child))
-            subtree_cache[entry_id] = max_value
-            return max_value
-
-        display_rows = []
-
-        def add_row(row, indent_level, has_children, is_child):
-            display_rows.append(
-                (row[0], row[1], row[2], indent_level, has_children, is_child)
-            )
+        key = self.display_rows_key(self.current_week)
+        if key not in self.display_rows_cache and self.rows_in_background():
+            self.start_display_rows_task(key)
+            return
+        self.show_display_rows(self.cached_display_rows(self.current_week))
 
-        def add_subtree(entry_id, indent_level):
-            row = id_to_row.get(entry_id)
-            if not row:
-                return
-            children = children_map.get(entry_id, [])
-            has_children = bool(children)
-            add_row(row, indent_level, has_children, indent_level > 0)
-            if has_children and entry_id not in self.collapsed_parents:
-                children_sorted = sorted(children, key=self.entry_date_key)
-                for child in children_sorted:
-                    child_id = child[2].get("id")
-                    if child_id is not None:
-                        add_subtree(child_id, indent_level + 1)
-                    else:
-                        add_row(child, indent_level + 1, False, True)
+    def rows_in_background(self):
+        return (
+            self.is_solo_view()
+            and len(self.entry_locations()) >= self.background_rows_threshold
+        )
 
+    def show_display_rows(self, rows):
+        self.all_display_specs, self.row_by_entry_id = rows
+        self.set_rows_pending(False)
         if self.is_solo_view():
-            parent_rows = []
-            for row in rows:
-                entry = row[2]
-                entry_id = entry.get("id")
-                if entry_id is not None and entry_id in child_ids:
-                    continue
-                if entry_id is None:
-                    parent_rows.append((self.entry_date_key(row), None, row))
-                else:
-                    parent_rows.append((subtree_max_date(entry_id), entry_id, row))
-            parent_rows.sort(key=lambda item: item[0], reverse=True)
-            for _, entry_id, row in parent_rows:
-                if entry_id is None:
-                    add_row(row, 0, False, False)
-                else:
-                    add_subtree(entry_id, 0)
+            start, end = self.display_window
+            end = max(end, start + self.list_page_size)
         else:
-            for row in rows:
-                entry = row[2]
-                entry_id = entry.get("id")
-                if entry_id is not None and entry_id in child_ids:
-                    continue
-                if entry_id is None:
-                    add_row(row, 0, False, False)
-                else:
-                    add_subtree(entry_id, 0)
-        entry_ids = []
-        id_to_row = {}
-        for row_index, row in enumerate(display_rows):
-            entry = row[2]
-            entry_id = entry.get("id")
-            if isinstance(entry_id, int):
-                entry_ids.append(entry_id)
-                id_to_row[entry_id] = row_index
-            else:
-                entry_ids.append(None)
-        direct_links = {}
-        for entry_id, entry in entries_by_id.items():
-            links = set(self.clean_links(entry.get("links")))
-            direct_links[entry_id] = links
-        mutual_links = {}
-        for entry_id, links in direct_links.items():
-            mutual_links[entry_id] = {
-                link_id
-                for link_id in links
-                if entry_id in direct_links.get(link_id, set())
-            }
-        connector_palette = [
-            "#f5b700",
-            "#1f78ff",
-            "#2ad54e",
-            "#ff4b3a",
-            "#8d5bff",
-            "#00b3a4",
-        ]
-        pair_colors = {}
-        color_index = 0
-
-        def pair_color(a_id, b_id):
-            nonlocal color_index
-            pair = tuple(sorted((a_id, b_id)))
-            color = pair_colors.get(pair)
-            if color:
-                return color
-            color = connector_palette[color_index % len(connector_palette)]
-            color_index += 1
-            pair_colors[pair] = color
-            return color
-
-        for week_index, index, entry, indent_level, has_children, is_child in display_rows:
-            title = entry.get("title", "Bitacora") or "Bitacora"
-            subtitle = entry.get("description", "")
-            subtitle = subtitle.replace("\n", " ").strip() or "Sin detalles"
-            links = self.clean_links(entry.get("links"))
-            if links:
-                subtitle = f"{subtitle} | Rel: {len(links)}"
-            time_text = str(entry.get("time", "")).strip()
-            if time_text:
-                subtitle = f"{subtitle} | {time_text}"
-            if len(subtitle) > 40:
-                subtitle = subtitle[:40].rstrip() + "..."
-            date_text = entry.get("date", "")
-            date_value = QDate.fromString(str(date_text), "yyyy-MM-dd")
-            if not date_value.isValid():
-                date_value = QDate.fromString(
-                    self.week_entry_date(week_index), "yyyy-MM-dd"
-                )
-            if not date_value.isValid():
-                date_value = QDate.currentDate()
-            item = QListWidgetItem(self.notes_list)
-            item.setData(Qt.UserRole, (week_index, index))
-            connector_color = None
-            connector_top = False
-            connector_bottom = False
-            entry_id = entry.get("id")
-            if isinstance(entry_id, int):
-                row_index = id_to_row.get(entry_id)
-                if row_index is not None:
-                    prev_entry_id = (
-                        entry_ids[row_index - 1] if row_index > 0 else None
-                    )
-                    next_entry_id = (
-                        entry_ids[row_index + 1]
-                        if row_index < len(entry_ids) - 1
-                        else None
-                    )
-                    linked_prev = (
-                        prev_entry_id in mutual_links.get(entry_id, set())
-                        if prev_entry_id is not None
-                        else False
-                    )
-                    linked_next = (
-                        next_entry_id in mutual_links.get(entry_id, set())
-                        if next_entry_id is not None
-                        else False
-                    )
-                    if linked_prev:
-                        connector_top = True
-                        connector_color = pair_color(entry_id, prev_entry_id)
-                    if linked_next:
-                        connector_bottom = True
-                        if connector_color is None:
-                            connector_color = pair_color(entry_id, next_entry_id)
-            widget = NoteItemWidget(
-                date_value,
-                title,
-                subtitle,
-                self.notes_list,
-                connector_color=connector_color,
-                connector_top=connector_top,
-                connector_bottom=connector_bottom,
-                indent_level=indent_level,
-                has_children=has_children,
-                collapsed=entry_id in self.collapsed_parents,
-                entry_id=entry_id,
-            )
-            if has_children:
-                widget.collapseClicked.connect(self.toggle_parent_collapse)
-            item.setSizeHint(widget.sizeHint())
-            self.notes_list.setItemWidget(item, widget)
+            start, end = 0, len(self.all_display_specs)
+        self.apply_display_window(start, end)
+
+    def apply_display_window(self, start, end):
+        specs = self.all_display_specs
+        start = self.page_start(start)
+        end = self.page_boundary(max(start, end))
+        self.display_window = (start, end)
+        window = specs[start:end]
+        if start > 0:
+            window = [(EARLIER_ROWS_KEY, None, start)] + window
+        self.apply_display_rows(window)
+
+    def page_start(self, start):
+        specs = self.all_display_specs
+        start = max(0, min(start, len(specs) - self.list_page_size))
+        while start > 0 and specs[start][2][7] > 0:
+            start -= 1
+        return start
+
+    def page_boundary(self, limit):
+        specs = self.all_display_specs
+        limit = min(limit, len(specs))
+        while limit < len(specs) and specs[limit][2][7] > 0:
+            limit += 1
+        return limit
+
+    def list_row(self, row):
+        start, end = self.display_window
+        if row is None or not start <= row < end:
+            return None
+        return row - start + (1 if start > 0 else 0)
+
+    def show_row_window(self, row):
+        start, end = self.display_window
+        if start <= row < end + self.list_page_size:
+            self.apply_display_window(start, row + 1)
+            return
+        start = max(0, row - self.list_page_size // 2)
+        self.apply_display_window(start, start + self.list_page_size)
+
+    def can_fetch_more_rows(self):
+        return self.display_window[1] < len(self.all_display_specs)
+
+    def fetch_more_rows(self):
+        if not self.can_fetch_more_rows():
+            return
+        start, end = self.display_window
+        self.apply_display_window(start, end + self.list_page_size)
+
+    def fetch_earlier_rows(self):
+        start, end = self.display_window
+        if start <= 0:
+            return
+        anchor = self.notes_list.item(1)
+        self.apply_display_window(start - self.list_page_size, end)
+        if anchor is not None:
+            self.notes_list.scrollToItem(anchor, QAbstractItemView.PositionAtTop)
+
+    def on_notes_scrolled(self, value):
+        scroll_bar = self.notes_list.verticalScrollBar()
+        if value >= scroll_bar.maximum() - scroll_bar.pageStep():
+            self.fetch_more_rows()
+        elif value <= scroll_bar.minimum():
+            self.fetch_earlier_rows()
+
+    def display_rows_key(self, week_index):
+        view = self.current_view()
+        return (
+            view,
+            "solo" if self.is_solo_view() else week_index,
+            self.filter_tag if view == "trabajo" else None,
+            frozenset(self.collapsed_parents),
+            self.data_versions.get(view, 0),
+        )
+
+    def cached_display_rows(self, week_index):
+        key = self.display_rows_key(week_index)
+        cached = self.display_rows_cache.get(key)
+        if cached is not None:
+            self.display_rows_cache.move_to_end(key)
+            self.refresh_counters["rows_hit"] += 1
+            return cached
+        self.refresh_counters["rows_built"] += 1
+        cached = self.build_display_rows(week_index)
+        self.store_display_rows(key, cached)
+        return cached
+
+    def store_display_rows(self, key, rows):
+        for stale_key in [
+            stale_key
+            for stale_key in self.display_rows_cache
+            if stale_key[0] == key[0] and stale_key[4] != key[4]
+        ]:
+            del self.display_rows_cache[stale_key]
+        self.display_rows_cache[key] = rows
+        while len(self.display_rows_cache) > self.display_rows_cache_size:
+            self.display_rows_cache.popitem(last=False)
+
+    def build_display_rows(self, week_index=None):
+        specs, row_by_entry_id, previews = compute_display_rows(
+            self.display_rows_snapshot(week_index)
+        )
+        self.merge_previews(previews)
+        return specs, row_by_entry_id
+
+    def apply_display_rows(self, specs):
+        previous = self.display_specs
+        scroll_bar = self.notes_list.verticalScrollBar()
+        scroll_bar.blockSignals(True)
+        self.notes_list.blockSignals(True)
+        matcher = SequenceMatcher(
+            None,
+            [spec[0] for spec in previous],
+            [spec[0] for spec in specs],
+            autojunk=False,
+        )
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == "equal":
+                for offset in range(i2 - i1):
+                    old_spec = previous[i1 + offset]
+                    new_spec = specs[j1 + offset]
+                    if old_spec[2] != new_spec[2]:
+                        item = self.notes_list.item(i1 + offset)
+                        self.set_note_item_widget(item, new_spec[2])
+                continue
+            for row in range(i2 - 1, i1 - 1, -1):
+                self.notes_list.takeItem(row)
+            for offset, spec in enumerate(specs[j1:j2]):
+                item = QListWidgetItem()
+                item.setData(Qt.UserRole, spec[1])
+                self.notes_list.insertItem(i1 + offset, item)
+                self.set_note_item_widget(item, spec[2])
+        self.display_specs = specs
         self.notes_list.blockSignals(False)
+        scroll_bar.blockSignals(False)
+        self.sync_current_note_item()
 
-    def select_entry_item(self, entry_index, week_index=None):
-        self.current_entry = None
-        if entry_index is None:
+    def sync_current_note_item(self):
+        current = self.notes_list.currentItem()
+        current_id = current.data(Qt.UserRole) if current is not None else None
+        if current_id == self.current_entry_id:
+            return
+        row = self.row_by_entry_id.get(self.current_entry_id)
+        if row is not None and self.list_row(row) is None:
+            self.show_row_window(row)
+            return
+        self.notes_list.blockSignals(True)
+        self.notes_list.setCurrentItem(
+            self.notes_list.item(self.list_row(row)) if row is not None else None
+        )
+        if row is None:
+            self.notes_list.clearSelection()
+        self.notes_list.blockSignals(False)
+        if row is None:
+            self.current_entry_id = None
             self.clear_entry_form()
+
+    def set_note_item_widget(self, item, render):
+        if isinstance(render, int):
+            self.set_earlier_rows_widget(item, render)
             return
-        for row in range(self.notes_list.count()):
-            item = self.notes_list.item(row)
-            data = item.data(Qt.UserRole)
-            if not data:
-                continue
-            if week_index is None and data[1] == entry_index:
-                self.notes_list.setCurrentItem(item)
-                self.current_entry = entry_index
-                return
-            if week_index is not None and data[0] == week_index and data[1] == entry_index:
-                self.notes_list.setCurrentItem(item)
-                self.current_entry = entry_index
-                return
-        self.notes_list.setCurrentItem(None)
+        (
+            date_text,
+            emoji,
+            title,
+            subtitle,
+            connector_color,
+            connector_top,
+            connector_bottom,
+            indent_level,
+            has_children,
+            collapsed,
+            entry_id,
+        ) = render
+        widget = NoteItemWidget(
+            QDate.fromString(date_text, "yyyy-MM-dd"),
+            title,
+            subtitle,
+            self.notes_list,
+            connector_color=connector_color,
+            connector_top=connector_top,
+            connector_bottom=connector_bottom,
+            indent_level=indent_level,
+            has_children=has_children,
+            collapsed=collapsed,
+            entry_id=entry_id,
+            title_emoji=emoji,
+        )
+        if has_children:
+            widget.collapseClicked.connect(self.toggle_parent_collapse)
+        item.setSizeHint(widget.sizeHint())
+        self.notes_list.setItemWidget(item, widget)
+
+    def set_earlier_rows_widget(self, item, count):
+        item.setFlags(Qt.NoItemFlags)
+        label = QLabel(f"{count} entradas mas recientes arriba", self.notes_list)
+        label.setAlignment(Qt.AlignCenter)
+        label.setStyleSheet("color: #6b655c; padding: 6px;")
+        item.setSizeHint(label.sizeHint())
+        self.notes_list.setItemWidget(item, label)
+
+    def select_entry_id(self, entry_id):
+        self.current_entry_id = None
+        if entry_id is None:
+            self.set_current_note_item(None)
+            self.clear_entry_form()
+            return
+        row = self.row_by_entry_id.get(entry_id)
+        if row is not None:
+            self.select_row(row)
+            self.current_entry_id = entry_id
+            return
+        self.set_current_note_item(None)
         self.clear_entry_form()
 
+    def select_row(self, row):
+        if self.list_row(row) is None:
+            self.show_row_window(row)
+        self.set_current_note_item(self.notes_list.item(self.list_row(row)))
+
+    def set_current_note_item(self, item):
+        if item is not None and item is self.notes_list.currentItem():
+            self.on_entry_selected(item, item)
+            return
+        self.notes_list.setCurrentItem(item)
+
     def on_entry_selected(self, current, previous):
         if current is None:
-            self.current_entry = None
+            self.current_entry_id = None
             self.clear_entry_form()
             return
-        data = current.data(Qt.UserRole)
-        if not data:
+        found = self.find_entry_by_id(current.data(Qt.UserRole))
+        if found is None:
             return
-        week_index, entry_index = data
+        week_index, _, entry = found
         self.current_week = week_index
-        entries = self.entries_for_week(week_index)
-        if 0 <= entry_index < len(entries):
-            entry = entries[entry_index]
-            self.current_entry = entry_index
-            self.title_input.setText(entry.get("title", ""))
-            self.desc_edit.setPlainText(entry.get("description", ""))
-            self.refresh_related_list(entry)
-            self.followup_button.setEnabled(True)
-            if self.life_widget.view_mode == "days":
-                date_text = str(entry.get("date", "")).strip()
-                date_value = QDate.fromString(date_text, "yyyy-MM-dd")
-                if date_value.isValid():
-                    self.life_widget.select_date(date_value)
+        self.current_entry_id = entry.get("id")
+        self.title_input.setText(entry.get("title", ""))
+        self.desc_edit.setPlainText(entry.get("description", ""))
+        self.refresh_related_list(entry)
+        self.followup_button.setEnabled(True)
+        if self.life_widget.is_daily_mode():
+            date_text = str(entry.get("date", "")).strip()
+            date_value = QDate.fromString(date_text, "yyyy-MM-dd")
+            if date_value.isValid():
+                self.life_widget.select_date(date_value)
         if not self.is_solo_view() and self.current_week != week_index:
             self.life_widget.select_week(week_index)
 
     def refresh_related_list(self, entry):
-        self.related_list.clear()
         if not isinstance(entry, dict):
+            self.related_model.set_entry_ids([])
             return
         links = self.clean_links(entry.get("links"))
-        for link_id in links:
-            found = self.find_entry_by_id(link_id)
-            if not found:
-                continue
-            week_index, entry_index, linked_entry = found
-            date_text = str(linked_entry.get("date", "")).strip()
-            title = linked_entry.get("title", "Entrada") or "Entrada"
-            label = f"{date_text} - {title}"
-            item = QListWidgetItem(label, self.related_list)
-            item.setData(Qt.UserRole, (link_id, week_index, entry_index))
-
-    def on_related_clicked(self, item):
-        data = item.data(Qt.UserRole)
-        if not data:
-            return
-        _, week_index, entry_index = data
-        if week_index is None:
+        found = self.find_entries_by_ids(links)
+        self.related_model.set_entry_ids(
+            [link_id for link_id in links if link_id in found]
+        )
+
+    def related_labels(self, entry_ids):
+        labels = {}
+        for entry_id, (_, _, entry) in self.find_entries_by_ids(entry_ids).items():
+            date_text = str(entry.get("date", "")).strip()
+            title = entry.get("title", "Entrada") or "Entrada"
+            labels[entry_id] = f"{date_text} - {title}"
+        return labels
+
+    def followup_ids(self, entry_id):
+        _, mutual_links = self.link_tables()
+        found = self.find_entries_by_ids(mutual_links.get(entry_id, ()))
+        rows = [
+            row
+            for row in found.values()
+            if self.is_action_entry(row[2])
+            and self.clean_links(row[2].get("links"))[:1] == [entry_id]
+        ]
+        rows.sort(key=self.entry_date_key)
+        return [row[2].get("id") for row in rows]
+
+    def on_related_clicked(self, index):
+        found = self.find_entry_by_id(index.data(Qt.UserRole))
+        if found is None:
             return
-        if self.is_solo_view():
-            self.select_entry_item(entry_index, week_index)
-        else:
+        week_index, _, entry = found
+        if not self.is_solo_view():
             self.life_widget.select_week(week_index)
-            self.refresh_entries_list()
-            self.select_entry_item(entry_index, week_index)
+        self.request_selection(entry.get("id"))
 
     def create_followup_entry(self):
-        if self.current_week is None or self.current_entry is None:
+        found = self.find_entry_by_id(self.current_entry_id)
+        if found is None:
             return
-        entries = self.entries_for_week(self.current_week)
-        if not (0 <= self.current_entry < len(entries)):
-            return
-        base_entry = entries[self.current_entry]
+        base_week, _, base_entry = found
         base_id = self.ensure_entry_id(base_entry)
         base_entry["links"] = self.clean_links(base_entry.get("links"))
 
         entry_date = self.selected_entry_date()
-        target_week = self.current_week
+        target_week = base_week
         date_value = QDate.fromString(entry_date, "yyyy-MM-dd")
         if date_value.isValid():
             week_index = self.life_widget.week_index_for_date(date_value)
@@ -675,18 +795,23 @@ class EntryControllerMixin:
         new_id = self.ensure_entry_id(new_entry)
         target_entries = self.current_notes().setdefault(target_week, [])
         target_entries.append(new_entry)
+        self.invalidate_entry_locations()
         if new_id not in base_entry["links"]:
             base_entry["links"].append(new_id)
+        self.update_entry_links(new_id, new_entry["links"])
+        self.update_entry_links(base_id, base_entry["links"])
+        self.touch_entry(new_entry, target_week)
+        self.touch_entry(base_entry, base_week)
 
         self.life_widget.select_week(target_week)
-        self.refresh_entries_list()
-        self.update_counts()
-        self.select_entry_item(len(target_entries) - 1, target_week)
-        self.save_data()
+        view = self.current_view()
+        self.journal_events.entry_added.emit(view, new_id)
+        self.journal_events.links_changed.emit(view, [base_id, new_id])
+        self.request_selection(new_id)
 
     def clear_entry_form(self):
         self.title_input.setText("")
         self.desc_edit.setPlainText("")
-        self.related_list.clear()
+        self.related_model.set_entry_ids([])
         self.followup_button.setEnabled(False)
         self.work_tag = None
@@ -1,4 +1,26 @@
-from PySide6.QtCore import QDate, QDateTime, QTime
+from itertools import chain
+from operator import is_
+
+from PySide6.QtCore import QDate, QObject, QTime, Signal
+
+from display_rows import (
+    CONNECTOR_PALETTE,
+    build_children_map,
+    clean_links,
+    entry_preview,
+    entry_sort_key,
+    is_action_entry,
+    link_pair,
+    snapshot_week,
+    update_link_tables,
+)
+
+
+class JournalEvents(QObject):
+    entry_added = Signal(str, int)
+    entry_changed = Signal(str, int, object)
+    entry_removed = Signal(str, int)
+    links_changed = Signal(str, object)
 
 
 class DataStoreMixin:
@@ -18,41 +40,11 @@ class DataStoreMixin:
             return "trabajo"
         return "bitacora"
 
-    def all_entries_for_view(self):
-        rows = []
-        for week_index, entries in self.current_notes().items():
-            if not isinstance(entries, list):
-                continue
-            for entry_index, entry in enumerate(entries):
-                rows.append((week_index, entry_index, entry))
-        rows.sort(key=self.entry_date_key, reverse=True)
-        return rows
-
     def entry_date_key(self, row):
-        entry = row[2]
-        date_text = str(entry.get("date", "")).strip()
-        date_value = QDate.fromString(date_text, "yyyy-MM-dd")
-        if not date_value.isValid():
-            date_value = QDate.fromString(
-                self.week_entry_date(row[0]), "yyyy-MM-dd"
-            )
-        time_text = str(entry.get("time", "")).strip()
-        time_value = QTime.fromString(time_text, "HH:mm")
-        if not time_value.isValid():
-            time_value = QTime(0, 0)
-        date_time = QDateTime(date_value, time_value)
-        return date_time.toSecsSinceEpoch()
+        return entry_sort_key(row[2], row[0], self.life_widget.birth_date.toPython())
 
     def clean_links(self, links):
-        if not isinstance(links, list):
-            return []
-        cleaned = []
-        for value in links:
-            if isinstance(value, int):
-                cleaned.append(value)
-            elif isinstance(value, str) and value.isdigit():
-                cleaned.append(int(value))
-        return cleaned
+        return clean_links(links)
 
     def ensure_entry_id(self, entry):
         entry_id = entry.get("id")
@@ -67,28 +59,197 @@ class DataStoreMixin:
 
     def remove_links_to(self, entry_id):
         if entry_id is None:
-            return
-        for entries in self.current_notes().values():
+            return []
+        linked_ids = []
+        for week_index, entries in self.current_notes().items():
             if not isinstance(entries, list):
                 continue
             for entry in entries:
                 links = entry.get("links")
                 if isinstance(links, list) and entry_id in links:
                     entry["links"] = [value for value in links if value != entry_id]
+                    self.update_entry_links(entry.get("id"), entry["links"])
+                    self.touch_entry(entry, week_index)
+                    linked_ids.append(entry.get("id"))
+        self.update_entry_links(entry_id, None)
+        return linked_ids
 
-    def find_entry_by_id(self, entry_id):
-        if entry_id is None:
-            return None
+    def touch_entry(self, entry, week_index):
+        entry_id = entry.get("id")
+        if not isinstance(entry_id, int):
+            return
+        version = self.entry_versions.get(entry_id, 0) + 1
+        self.entry_versions[entry_id] = version
+        self.preview_cache[entry_id] = (version, entry_preview(entry))
+        self.week_snapshots.pop((self.current_view(), week_index), None)
+
+    def week_snapshot(self, view, week_index, entries):
+        cached = self.week_snapshots.get((view, week_index))
+        if (
+            cached is not None
+            and len(cached[0]) == len(entries)
+            and all(map(is_, cached[0], entries))
+        ):
+            return cached[1]
+        rows = snapshot_week(week_index, entries, self.entry_versions)
+        self.week_snapshots[(view, week_index)] = (tuple(entries), rows)
+        return rows
+
+    def prime_entry_previews(self):
+        self.entry_versions = {}
+        self.week_snapshots = {}
+        self.preview_cache = {}
+        for notes in (self.week_notes, self.work_notes):
+            for entries in notes.values():
+                if not isinstance(entries, list):
+                    continue
+                for entry in entries:
+                    entry_id = entry.get("id")
+                    if isinstance(entry_id, int):
+                        self.preview_cache[entry_id] = (0, entry_preview(entry))
+
+    def merge_previews(self, previews):
+        for entry_id, cached in previews.items():
+            if cached[0] == self.entry_versions.get(entry_id, 0):
+                self.preview_cache[entry_id] = cached
+
+    def link_tables(self):
+        if self.mutual_links is None:
+            if self.loading:
+                return {}, {}
+            self.rebuild_link_tables()
+        return self.direct_links, self.mutual_links
+
+    def invalidate_link_tables(self):
+        self.direct_links = {}
+        self.mutual_links = None
+
+    def rebuild_link_tables(self):
+        direct_links = {}
+        for notes in (self.week_notes, self.work_notes):
+            for entries in notes.values():
+                if not isinstance(entries, list):
+                    continue
+                for entry in entries:
+                    entry_id = entry.get("id")
+                    links = frozenset(clean_links(entry.get("links")))
+                    if isinstance(entry_id, int) and links:
+                        direct_links[entry_id] = links
+        mutual_links = {}
+        pairs = set()
+        for entry_id, links in direct_links.items():
+            linked = frozenset(
+                link_id
+                for link_id in links
+                if entry_id in direct_links.get(link_id, ())
+            )
+            if linked:
+                mutual_links[entry_id] = linked
+                pairs.update(
+                    link_pair(entry_id, link_id)
+                    for link_id in linked
+                    if link_id != entry_id
+                )
+        self.direct_links = direct_links
+        self.mutual_links = mutual_links
+        self.prune_connector_colors()
+        for pair in sorted(pairs):
+            if pair not in self.connector_colors:
+                self.assign_connector_color(pair)
+
+    def prune_connector_colors(self):
+        if self.mutual_links is None:
+            return
+        self.connector_colors = {
+            pair: color_index
+            for pair, color_index in self.connector_colors.items()
+            if pair[0] != pair[1] and pair[1] in self.mutual_links.get(pair[0], ())
+        }
+
+    def update_entry_links(self, entry_id, links):
+        if self.mutual_links is None or not isinstance(entry_id, int):
+            return
+        self.apply_mutual_changes(
+            update_link_tables(self.direct_links, self.mutual_links, entry_id, links)
+        )
+
+    def apply_link_changes(self, direct_links, mutual_changes):
+        for entry_id, links in direct_links.items():
+            if links:
+                self.direct_links[entry_id] = links
+            else:
+                self.direct_links.pop(entry_id, None)
+        for entry_id, (_, linked) in mutual_changes.items():
+            if linked:
+                self.mutual_links[entry_id] = linked
+            else:
+                self.mutual_links.pop(entry_id, None)
+        self.apply_mutual_changes(mutual_changes)
+
+    def apply_mutual_changes(self, changes):
+        for entry_id, (previous, current) in changes.items():
+            for link_id in current - previous:
+                pair = link_pair(entry_id, link_id)
+                if link_id != entry_id and pair not in self.connector_colors:
+                    self.assign_connector_color(pair)
+            for link_id in previous - current:
+                self.connector_colors.pop(link_pair(entry_id, link_id), None)
+
+    def assign_connector_color(self, pair):
+        self.connector_colors[pair] = len(self.connector_colors) % len(
+            CONNECTOR_PALETTE
+        )
+
+    def entry_locations(self):
+        view = self.current_view()
+        locations = self.location_index.get(view)
+        if locations is not None:
+            return locations
+        locations = {}
         for week_index, entries in self.current_notes().items():
             if not isinstance(entries, list):
                 continue
             for entry_index, entry in enumerate(entries):
+                entry_id = entry.get("id")
+                if isinstance(entry_id, int):
+                    locations[entry_id] = (week_index, entry_index)
+        self.location_index[view] = locations
+        return locations
+
+    def invalidate_entry_locations(self):
+        self.location_index = {}
+
+    def mark_data_changed(self, view=None):
+        views = [view] if view is not None else list(self.data_versions)
+        for name in views:
+            self.data_versions[name] = self.data_versions.get(name, 0) + 1
+
+    def find_entry_by_id(self, entry_id):
+        if entry_id is None:
+            return None
+        return self.find_entries_by_ids((entry_id,)).get(entry_id)
+
+    def find_entries_by_ids(self, entry_ids):
+        locations = self.entry_locations()
+        notes = self.current_notes()
+        found = {}
+        for entry_id in entry_ids:
+            location = locations.get(entry_id)
+            if location is None:
+                continue
+            week_index, entry_index = location
+            entries = notes.get(week_index, [])
+            if 0 <= entry_index < len(entries):
+                entry = entries[entry_index]
                 if entry.get("id") == entry_id:
-                    return week_index, entry_index, entry
-        return None
+                    found[entry_id] = (week_index, entry_index, entry)
+                    continue
+            self.invalidate_entry_locations()
+            return self.find_entries_by_ids(entry_ids)
+        return found
 
     def selected_entry_date(self):
-        if self.life_widget.view_mode == "days":
+        if self.life_widget.is_daily_mode():
             date_value = self.life_widget.selected_date
             if date_value is not None and date_value.isValid():
                 return date_value.toString("yyyy-MM-dd")
@@ -104,33 +265,22 @@ class DataStoreMixin:
         return date_value.toString("yyyy-MM-dd")
 
     def is_action_entry(self, entry):
-        if entry.get("action") is True:
-            return True
-        title = str(entry.get("title", "")).strip().lower()
-        return title.startswith("accion tomada")
+        return is_action_entry(entry)
 
-    def action_parent_id(self, entry, entries_by_id):
-        if not self.is_action_entry(entry):
-            return None
-        links = self.clean_links(entry.get("links"))
-        if not links:
-            return None
-        parent_id = links[0]
-        parent = entries_by_id.get(parent_id)
-        if not parent:
-            return None
-        parent_links = self.clean_links(parent.get("links"))
-        if entry.get("id") not in parent_links:
-            return None
-        return parent_id
-
-    def filtered_rows(self):
+    def filtered_rows(self, week_index=None):
+        if week_index is None:
+            week_index = self.current_week
         if self.is_solo_view():
-            rows = self.all_entries_for_view()
+            rows = [
+                (row_week, entry_index, entry)
+                for row_week, entries in self.current_notes().items()
+                if isinstance(entries, list)
+                for entry_index, entry in enumerate(entries)
+            ]
         else:
             rows = [
-                (self.current_week, index, entry)
-                for index, entry in enumerate(self.entries_for_week(self.current_week))
+                (week_index, index, entry)
+                for index, entry in enumerate(self.entries_for_week(week_index))
             ]
         if self.current_view() == "trabajo" and self.filter_tag:
             rows = [
@@ -139,23 +289,34 @@ class DataStoreMixin:
         return rows
 
     def build_children_map(self, rows):
-        id_to_row = {}
-        entries_by_id = {}
-        for row in rows:
-            entry = row[2]
-            entry_id = entry.get("id")
-            if isinstance(entry_id, int):
-                id_to_row[entry_id] = row
-                entries_by_id[entry_id] = entry
-        children_map = {}
-        child_ids = set()
-        for row in rows:
-            entry = row[2]
-            entry_id = entry.get("id")
-            parent_id = self.action_parent_id(entry, entries_by_id)
-            if parent_id is None or entry_id is None:
-                continue
-            if parent_id in id_to_row:
-                children_map.setdefault(parent_id, []).append(row)
-                child_ids.add(entry_id)
-        return children_map, child_ids, id_to_row, entries_by_id
+        return build_children_map(rows)
+
+    def display_rows_snapshot(self, week_index=None):
+        if week_index is None:
+            week_index = self.current_week
+        solo = self.is_solo_view()
+        view = self.current_view()
+        if solo:
+            rows = tuple(
+                chain.from_iterable(
+                    self.week_snapshot(view, row_week, entries)
+                    for row_week, entries in self.current_notes().items()
+                    if isinstance(entries, list)
+                )
+            )
+        else:
+            rows = self.week_snapshot(
+                view, week_index, self.entries_for_week(week_index)
+            )
+        return {
+            "solo": solo,
+            "rows": rows,
+            "filter_tag": self.filter_tag if view == "trabajo" else None,
+            "tag_set": frozenset(self.work_tag_set),
+            "collapsed": frozenset(self.collapsed_parents),
+            "birth_date": self.life_widget.birth_date.toString("yyyy-MM-dd"),
+            "today": QDate.currentDate().toString("yyyy-MM-dd"),
+            "previews": self.preview_cache,
+            "mutual_links": self.link_tables()[1],
+            "pair_colors": self.connector_colors,
+        }
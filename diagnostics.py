@@ -0,0 +1,213 @@
+import json
+import threading
+import time
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QDockWidget,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+import controllers
+import data_store
+import display_rows
+import refresh
+
+
+WINDOW_METHODS = (
+    "load_data",
+    "start_loading",
+    "on_journal_chunk",
+    "on_journal_loaded",
+    "save_data",
+    "refresh_entries_list",
+    "build_display_rows",
+    "update_counts",
+)
+
+DISPLAY_ROWS_FUNCTIONS = ("compute_display_rows", "build_children_map")
+
+DISPLAY_ROWS_IMPORTERS = (controllers, data_store, refresh)
+
+HEATMAP_METHODS = (
+    "paintEvent",
+    "paint_cell_rows",
+    "paint_cells",
+    "paint_life_image",
+    "paint_labels",
+)
+
+
+class Timings:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.lock = threading.Lock()
+        self.stats = {}
+        self.marks = {}
+        self.counters = {}
+
+    def record(self, name, seconds):
+        with self.lock:
+            stat = self.stats.setdefault(name, [0, 0.0, 0.0])
+            stat[0] += 1
+            stat[1] += seconds
+            stat[2] = max(stat[2], seconds)
+
+    def mark(self, name):
+        if name not in self.marks:
+            self.marks[name] = round((time.perf_counter() - self.started) * 1000, 3)
+
+    def track(self, name, counter):
+        self.counters[name] = counter
+
+    def report(self):
+        with self.lock:
+            stats = {name: list(stat) for name, stat in self.stats.items()}
+        timings = {}
+        for name, (calls, total, longest) in sorted(stats.items()):
+            timings[name] = {
+                "calls": calls,
+                "total_ms": round(total * 1000, 3),
+                "mean_ms": round(total * 1000 / calls, 3),
+                "max_ms": round(longest * 1000, 3),
+            }
+        counters = {
+            name: dict(sorted(counter.items()))
+            for name, counter in self.counters.items()
+        }
+        return {"marks_ms": dict(self.marks), "timings": timings, "counters": counters}
+
+    def dump(self, path):
+        try:
+            with open(path, "w", encoding="utf-8") as handle:
+                json.dump(self.report(), handle, indent=2)
+        except OSError:
+            return False
+        return True
+
+
+def timed(method, name, timings):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            timings.record(name, time.perf_counter() - start)
+
+    return wrapper
+
+
+def instrument(target, names, timings, prefix=""):
+    for name in names:
+        method = getattr(target, name, None)
+        if method is not None:
+            setattr(target, name, timed(method, prefix + name, timings))
+
+
+def instrument_functions(module, names, timings, importers=()):
+    for name in names:
+        function = getattr(module, name, None)
+        if function is None:
+            continue
+        wrapper = timed(function, f"{module.__name__}.{name}", timings)
+        for target in (module, *importers):
+            if getattr(target, name, None) is function:
+                setattr(target, name, wrapper)
+
+
+def marked(method, name, timings):
+    def wrapper(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        finally:
+            timings.mark(name)
+
+    return wrapper
+
+
+class DiagnosticsDock(QDockWidget):
+    def __init__(self, timings, output_path, parent=None):
+        super().__init__("Diagnostico", parent)
+        self.timings = timings
+        self.output_path = output_path
+        content = QWidget(self)
+        layout = QVBoxLayout(content)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(6)
+        self.marks_label = QLabel(content)
+        self.marks_label.setWordWrap(True)
+        self.table = QTableWidget(0, 5, content)
+        self.table.setHorizontalHeaderLabels(
+            ["Funcion", "Llamadas", "Total ms", "Media ms", "Max ms"]
+        )
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.export_button = QPushButton("Exportar JSON", content)
+        self.export_button.clicked.connect(self.export_report)
+        self.status_label = QLabel(content)
+        layout.addWidget(self.marks_label)
+        layout.addWidget(self.table, 1)
+        layout.addWidget(self.export_button)
+        layout.addWidget(self.status_label)
+        self.setWidget(content)
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(1000)
+        self.refresh_timer.timeout.connect(self.refresh_report)
+        self.refresh_timer.start()
+
+    def refresh_report(self):
+        if not self.isVisible():
+            return
+        report = self.timings.report()
+        lines = [
+            "  ".join(
+                f"{name}: {value} ms" for name, value in report["marks_ms"].items()
+            )
+        ]
+        for name, counter in report["counters"].items():
+            values = "  ".join(f"{part}: {count}" for part, count in counter.items())
+            lines.append(f"{name}: {values}")
+        self.marks_label.setText("\n".join(lines))
+        rows = report["timings"]
+        self.table.setRowCount(len(rows))
+        for row, (name, stat) in enumerate(rows.items()):
+            values = [
+                name,
+                stat["calls"],
+                stat["total_ms"],
+                stat["mean_ms"],
+                stat["max_ms"],
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                if column:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, column, item)
+        self.table.resizeColumnsToContents()
+
+    def export_report(self):
+        if self.timings.dump(self.output_path):
+            self.status_label.setText(f"Guardado en {self.output_path}")
+        else:
+            self.status_label.setText("No se pudo guardar el informe")
+
+
+def enable_diagnostics(window, output_path, timings=None):
+    timings = timings or Timings()
+    instrument(window, WINDOW_METHODS, timings)
+    instrument(window.life_widget, HEATMAP_METHODS, timings, "LifeWeeksWidget.")
+    instrument_functions(
+        display_rows, DISPLAY_ROWS_FUNCTIONS, timings, DISPLAY_ROWS_IMPORTERS
+    )
+    window.finish_loading = marked(window.finish_loading, "journal_loaded", timings)
+    timings.track("refresh_counters", window.refresh_counters)
+    timings.track("max_flush_work", window.max_flush_work)
+    dock = DiagnosticsDock(timings, output_path, window)
+    window.addDockWidget(Qt.RightDockWidgetArea, dock)
+    window.diagnostics_dock = dock
+    return timings
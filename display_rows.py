@@ -0,0 +1,368 @@
+from datetime import date, timedelta
+
+
+CONNECTOR_PALETTE = [
+    "#f5b700",
+    "#1f78ff",
+    "#2ad54e",
+    "#ff4b3a",
+    "#8d5bff",
+    "#00b3a4",
+]
+
+
+def parse_date(text):
+    if len(text) != 10 or text[4] != "-" or text[7] != "-":
+        return None
+    year, month, day = text[:4], text[5:7], text[8:]
+    if not (year.isdigit() and month.isdigit() and day.isdigit()):
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def parse_minutes(text):
+    if len(text) != 5 or text[2] != ":":
+        return None
+    hours, minutes = text[:2], text[3:]
+    if not (hours.isdigit() and minutes.isdigit()):
+        return None
+    hours, minutes = int(hours), int(minutes)
+    if hours > 23 or minutes > 59:
+        return None
+    return hours * 60 + minutes
+
+
+def week_date(birth_date, week_index):
+    try:
+        return birth_date + timedelta(days=week_index * 7)
+    except OverflowError:
+        return None
+
+
+def entry_sort_key(entry, week_index, birth_date):
+    day = parse_date(str(entry.get("date", "")).strip())
+    if day is None:
+        day = week_date(birth_date, week_index) or birth_date
+    minutes = parse_minutes(str(entry.get("time", "")).strip()) or 0
+    return day.toordinal() * 86400 + minutes * 60
+
+
+def clean_links(links):
+    if not isinstance(links, (list, tuple)):
+        return []
+    cleaned = []
+    for value in links:
+        if isinstance(value, int):
+            cleaned.append(value)
+        elif isinstance(value, str) and value.isdigit():
+            cleaned.append(int(value))
+    return cleaned
+
+
+def is_action_entry(entry):
+    if entry.get("action") is True:
+        return True
+    title = str(entry.get("title", "")).strip().lower()
+    return title.startswith("accion tomada")
+
+
+def action_parent_id(entry, entries_by_id):
+    if not is_action_entry(entry):
+        return None
+    links = clean_links(entry.get("links"))
+    if not links:
+        return None
+    parent_id = links[0]
+    parent = entries_by_id.get(parent_id)
+    if not parent:
+        return None
+    parent_links = clean_links(parent.get("links"))
+    if entry.get("id") not in parent_links:
+        return None
+    return parent_id
+
+
+def link_pair(a_id, b_id):
+    return (a_id, b_id) if a_id < b_id else (b_id, a_id)
+
+
+def update_link_tables(direct_links, mutual_links, entry_id, links):
+    previous = direct_links.get(entry_id, frozenset())
+    current = frozenset(clean_links(links))
+    if current:
+        direct_links[entry_id] = current
+    else:
+        direct_links.pop(entry_id, None)
+    changes = {}
+    affected = previous | current | mutual_links.get(entry_id, frozenset())
+    for other_id in affected | {entry_id}:
+        before = mutual_links.get(other_id, frozenset())
+        after = frozenset(
+            link_id
+            for link_id in direct_links.get(other_id, ())
+            if other_id in direct_links.get(link_id, ())
+        )
+        if after:
+            mutual_links[other_id] = after
+        else:
+            mutual_links.pop(other_id, None)
+        if after != before:
+            changes[other_id] = (before, after)
+    return changes
+
+
+def entry_tag(entry, tag_set):
+    title = str(entry.get("title", "")).strip()
+    if len(title) >= 2 and title[1] == " ":
+        emoji = title[0]
+        if emoji in tag_set:
+            return emoji
+    return None
+
+
+def build_children_map(rows):
+    id_to_row = {}
+    entries_by_id = {}
+    for row in rows:
+        entry = row[2]
+        entry_id = entry.get("id")
+        if isinstance(entry_id, int):
+            id_to_row[entry_id] = row
+            entries_by_id[entry_id] = entry
+    children_map = {}
+    child_ids = set()
+    for row in rows:
+        entry = row[2]
+        entry_id = entry.get("id")
+        parent_id = action_parent_id(entry, entries_by_id)
+        if parent_id is None or entry_id is None:
+            continue
+        if parent_id in id_to_row:
+            children_map.setdefault(parent_id, []).append(row)
+            child_ids.add(entry_id)
+    return children_map, child_ids, id_to_row, entries_by_id
+
+
+def split_title_emoji(title):
+    if not title:
+        return "", ""
+    value = title.strip()
+    if len(value) >= 2 and value[1] == " ":
+        emoji = value[0]
+        return emoji, value[2:].lstrip()
+    return "", value
+
+
+def entry_preview(entry):
+    title = entry.get("title", "Bitacora") or "Bitacora"
+    emoji, clean_title = split_title_emoji(title)
+    description = entry.get("description", "")
+    links = clean_links(entry.get("links"))
+    time_text = str(entry.get("time", "")).strip()
+    subtitle = description.replace("\n", " ").strip() or "Sin detalles"
+    if links:
+        subtitle = f"{subtitle} | Rel: {len(links)}"
+    if time_text:
+        subtitle = f"{subtitle} | {time_text}"
+    if len(subtitle) > 40:
+        subtitle = subtitle[:40].rstrip() + "..."
+    return emoji, clean_title, subtitle
+
+
+def snapshot_entry(entry, version=0):
+    return {
+        "id": entry.get("id"),
+        "version": version,
+        "title": entry.get("title", ""),
+        "description": entry.get("description", ""),
+        "date": entry.get("date", ""),
+        "time": entry.get("time", ""),
+        "action": entry.get("action"),
+        "links": tuple(clean_links(entry.get("links"))),
+    }
+
+
+def snapshot_week(week_index, entries, versions):
+    return tuple(
+        (
+            week_index,
+            entry_index,
+            snapshot_entry(entry, versions.get(entry.get("id"), 0)),
+        )
+        for entry_index, entry in enumerate(entries)
+    )
+
+
+def compute_display_rows(snapshot):
+    birth_date = parse_date(snapshot["birth_date"]) or date.today()
+    today_text = snapshot["today"]
+    collapsed = snapshot["collapsed"]
+    preview_cache = snapshot["previews"]
+    rows = list(snapshot["rows"])
+    if snapshot["filter_tag"]:
+        rows = [
+            row
+            for row in rows
+            if entry_tag(row[2], snapshot["tag_set"]) == snapshot["filter_tag"]
+        ]
+
+    sort_keys = {}
+
+    def entry_date_key(row):
+        cache_key = id(row)
+        cached = sort_keys.get(cache_key)
+        if cached is not None:
+            return cached
+        key = entry_sort_key(row[2], row[0], birth_date)
+        sort_keys[cache_key] = key
+        return key
+
+    if snapshot["solo"]:
+        rows.sort(key=entry_date_key, reverse=True)
+    children_map, child_ids, id_to_row, entries_by_id = build_children_map(rows)
+
+    subtree_cache = {}
+
+    def subtree_max_date(entry_id):
+        cached = subtree_cache.get(entry_id)
+        if cached is not None:
+            return cached
+        row = id_to_row.get(entry_id)
+        if not row:
+            return 0
+        max_value = entry_date_key(row)
+        for child in children_map.get(entry_id, []):
+            child_id = child[2].get("id")
+            if child_id is not None:
+                max_value = max(max_value, subtree_max_date(child_id))
+            else:
+                max_value = max(max_value, entry_date_key(child))
+        subtree_cache[entry_id] = max_value
+        return max_value
+
+    display_rows = []
+
+    def add_row(row, indent_level, has_children, is_child):
+        display_rows.append(
+            (row[0], row[1], row[2], indent_level, has_children, is_child)
+        )
+
+    def add_subtree(entry_id, indent_level):
+        row = id_to_row.get(entry_id)
+        if not row:
+            return
+        children = children_map.get(entry_id, [])
+        has_children = bool(children)
+        add_row(row, indent_level, has_children, indent_level > 0)
+        if has_children and entry_id not in collapsed:
+            children_sorted = sorted(children, key=entry_date_key)
+            for child in children_sorted:
+                child_id = child[2].get("id")
+                if child_id is not None:
+                    add_subtree(child_id, indent_level + 1)
+                else:
+                    add_row(child, indent_level + 1, False, True)
+
+    if snapshot["solo"]:
+        parent_rows = []
+        for row in rows:
+            entry_id = row[2].get("id")
+            if entry_id is not None and entry_id in child_ids:
+                continue
+            if entry_id is None:
+                parent_rows.append((entry_date_key(row), None, row))
+            else:
+                parent_rows.append((subtree_max_date(entry_id), entry_id, row))
+        parent_rows.sort(key=lambda item: item[0], reverse=True)
+        for _, entry_id, row in parent_rows:
+            if entry_id is None:
+                add_row(row, 0, False, False)
+            else:
+                add_subtree(entry_id, 0)
+    else:
+        for row in rows:
+            entry_id = row[2].get("id")
+            if entry_id is not None and entry_id in child_ids:
+                continue
+            if entry_id is None:
+                add_row(row, 0, False, False)
+            else:
+                add_subtree(entry_id, 0)
+
+    entry_ids = []
+    position_by_id = {}
+    for row_index, row in enumerate(display_rows):
+        entry_id = row[2].get("id")
+        if isinstance(entry_id, int):
+            entry_ids.append(entry_id)
+            position_by_id[entry_id] = row_index
+        else:
+            entry_ids.append(None)
+    mutual_links = snapshot["mutual_links"]
+    pair_colors = snapshot["pair_colors"]
+
+    def pair_color(a_id, b_id):
+        pair = link_pair(a_id, b_id)
+        color_index = pair_colors.get(pair)
+        if color_index is None:
+            color_index = pair[0] + pair[1]
+        return CONNECTOR_PALETTE[color_index % len(CONNECTOR_PALETTE)]
+
+    specs = []
+    row_by_entry_id = {}
+    previews = {}
+    for week_index, index, entry, indent_level, has_children, is_child in display_rows:
+        entry_id = entry.get("id")
+        version = entry.get("version", 0)
+        cached = preview_cache.get(entry_id)
+        if cached is not None and cached[0] == version:
+            emoji, title, subtitle = cached[1]
+        else:
+            emoji, title, subtitle = entry_preview(entry)
+            if isinstance(entry_id, int):
+                previews[entry_id] = (version, (emoji, title, subtitle))
+        date_text = str(entry.get("date", ""))
+        if parse_date(date_text) is None:
+            fallback = week_date(birth_date, week_index)
+            date_text = fallback.isoformat() if fallback else today_text
+        connector_color = None
+        connector_top = False
+        connector_bottom = False
+        if isinstance(entry_id, int):
+            row_index = position_by_id.get(entry_id)
+            if row_index is not None:
+                prev_entry_id = entry_ids[row_index - 1] if row_index > 0 else None
+                next_entry_id = (
+                    entry_ids[row_index + 1]
+                    if row_index < len(entry_ids) - 1
+                    else None
+                )
+                entry_mutual = mutual_links.get(entry_id, frozenset())
+                if prev_entry_id is not None and prev_entry_id in entry_mutual:
+                    connector_top = True
+                    connector_color = pair_color(entry_id, prev_entry_id)
+                if next_entry_id is not None and next_entry_id in entry_mutual:
+                    connector_bottom = True
+                    if connector_color is None:
+                        connector_color = pair_color(entry_id, next_entry_id)
+        key = entry_id if isinstance(entry_id, int) else (week_index, index)
+        render = (
+            date_text,
+            emoji,
+            title,
+            subtitle,
+            connector_color,
+            connector_top,
+            connector_bottom,
+            indent_level,
+            has_children,
+            entry_id in collapsed,
+            entry_id,
+        )
+        if isinstance(entry_id, int):
+            row_by_entry_id[entry_id] = len(specs)
+        specs.append((key, entry_id, render))
+    return specs, row_by_entry_id, previews
@@ -0,0 +1,133 @@
+import argparse
+import json
+import random
+from datetime import date, timedelta
+
+
+END_DATE = date(2025, 1, 1)
+
+WORK_TAGS = ["\U0001F7E2", "\U0001F534", "\U0001F6C8", "\u26A0\ufe0f"]
+
+WORDS = (
+    "reunion proyecto entrega cliente revision informe llamada equipo plan "
+    "semana avance problema solucion idea viaje familia salud lectura notas "
+    "pendiente decision resultado prueba cambio objetivo tarea correo "
+    "presupuesto calendario seguimiento mejora riesgo acuerdo"
+).split()
+
+
+def make_description(rng, paragraphs):
+    lines = []
+    for _ in range(rng.randint(*paragraphs)):
+        words = rng.choices(WORDS, k=rng.randint(12, 60))
+        lines.append(" ".join(words).capitalize() + ".")
+    return "\n".join(lines)
+
+
+def generate_journal(
+    entry_count,
+    seed=1,
+    birth_date=date(1990, 3, 1),
+    years=90,
+    work_share=0.4,
+    tag_share=0.7,
+    followup_share=0.2,
+    link_density=0.05,
+    paragraphs=(1, 6),
+    chain_window=200,
+    end_date=END_DATE,
+):
+    rng = random.Random(seed)
+    start_day = birth_date + timedelta(days=18 * 365)
+    span_days = max(1, (end_date - start_day).days)
+    notes = {}
+    work_notes = {}
+    recent = {"bitacora": [], "trabajo": []}
+    for entry_id in range(1, entry_count + 1):
+        view = "trabajo" if rng.random() < work_share else "bitacora"
+        pool = recent[view]
+        parent = None
+        if pool and rng.random() < followup_share:
+            parent = rng.choice(pool[-chain_window:])
+            entry_day = date.fromisoformat(parent["date"]) + timedelta(
+                days=rng.randint(0, 30)
+            )
+            entry_day = min(entry_day, end_date)
+            title = "Accion tomada"
+        else:
+            entry_day = start_day + timedelta(days=rng.randrange(span_days))
+            title = f"Nota {entry_id}"
+        if view == "trabajo" and rng.random() < tag_share:
+            title = f"{rng.choice(WORK_TAGS)} {title}"
+        entry = {
+            "title": title,
+            "description": make_description(rng, paragraphs),
+            "date": entry_day.isoformat(),
+            "time": f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+            "action": parent is not None,
+            "links": [],
+            "id": entry_id,
+        }
+        if parent is not None:
+            entry["links"].append(parent["id"])
+            parent["links"].append(entry_id)
+        elif pool and rng.random() < link_density:
+            other = rng.choice(pool)
+            entry["links"].append(other["id"])
+            other["links"].append(entry_id)
+        week_index = (entry_day - birth_date).days // 7
+        target = work_notes if view == "trabajo" else notes
+        target.setdefault(str(week_index), []).append(entry)
+        pool.append(entry)
+    return {
+        "birth_date": birth_date.isoformat(),
+        "years": years,
+        "next_entry_id": entry_count + 1,
+        "heatmap_color": "#3b7c7a",
+        "heatmap_color_trabajo": "#2f3b59",
+        "main_color": "#3b7c7a",
+        "notes": notes,
+        "work_notes": work_notes,
+    }
+
+
+def write_journal(path, entry_count, **options):
+    data = generate_journal(entry_count, **options)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, ensure_ascii=True)
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic journal")
+    parser.add_argument("output", help="path of the JSON journal to write")
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--work-share", type=float, default=0.4)
+    parser.add_argument("--tag-share", type=float, default=0.7)
+    parser.add_argument("--followup-share", type=float, default=0.2)
+    parser.add_argument("--link-density", type=float, default=0.05)
+    parser.add_argument("--min-paragraphs", type=int, default=1)
+    parser.add_argument("--max-paragraphs", type=int, default=6)
+    parser.add_argument(
+        "--end-date",
+        type=date.fromisoformat,
+        default=END_DATE,
+        help="last day entries may fall on (YYYY-MM-DD)",
+    )
+    args = parser.parse_args()
+    write_journal(
+        args.output,
+        args.entries,
+        seed=args.seed,
+        work_share=args.work_share,
+        tag_share=args.tag_share,
+        followup_share=args.followup_share,
+        link_density=args.link_density,
+        paragraphs=(args.min_paragraphs, args.max_paragraphs),
+        end_date=args.end_date,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,43 @@
+import argparse
+import os
 import sys
 
 from PySide6.QtWidgets import QApplication
 
+from diagnostics import Timings, enable_diagnostics
 from main_window import MainWindow
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=os.environ.get("BITACORA_PROFILE", "") not in ("", "0"),
+    )
+    parser.add_argument(
+        "--profile-output",
+        default=os.environ.get("BITACORA_PROFILE_OUTPUT", "bitacora_timings.json"),
+    )
+    return parser.parse_known_args()
+
+
 def main():
-    app = QApplication(sys.argv)
+    args, qt_args = parse_args()
+    timings = None
+    if args.profile:
+        timings = Timings()
+    app = QApplication([sys.argv[0]] + qt_args)
     window = MainWindow()
+    if timings is not None:
+        timings.mark("window_created")
+        enable_diagnostics(window, args.profile_output, timings)
+        app.aboutToQuit.connect(lambda: timings.dump(args.profile_output))
     window.resize(1000, 720)
     window.showMaximized()
+    window.start_loading()
+    if timings is not None:
+        timings.mark("window_shown")
     sys.exit(app.exec())
 
 
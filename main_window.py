@@ -1,11 +1,13 @@
 import os
+from collections import OrderedDict
 
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QMainWindow
 
 from controllers import EntryControllerMixin, ViewControllerMixin
-from data_store import DataStoreMixin
+from data_store import DataStoreMixin, JournalEvents
 from persistence import PersistenceMixin
+from refresh import RefreshSchedulerMixin
 from theme import apply_theme
 from ui_builder import UiBuilderMixin
 
@@ -17,6 +19,7 @@ class MainWindow(
     ViewControllerMixin,
     DataStoreMixin,
     PersistenceMixin,
+    RefreshSchedulerMixin,
 ):
     def __init__(self):
         super().__init__()
@@ -24,11 +27,30 @@ class MainWindow(
         self.week_notes = {}
         self.work_notes = {}
         self.current_week = None
-        self.current_entry = None
+        self.current_entry_id = None
         self.loading = False
         self.work_tag = None
         self.filter_tag = None
         self.collapsed_parents = set()
+        self.location_index = {}
+        self.display_specs = []
+        self.all_display_specs = []
+        self.display_window = (0, 0)
+        self.row_by_entry_id = {}
+        self.list_page_size = 50
+        self.display_rows_cache = OrderedDict()
+        self.display_rows_cache_size = 16
+        self.prefetch_week_count = 4
+        self.background_rows_threshold = 2000
+        self.last_week_step = 1
+        self.data_versions = {"bitacora": 0, "trabajo": 0}
+        self.preview_cache = {}
+        self.entry_versions = {}
+        self.week_snapshots = {}
+        self.counts_cache = {}
+        self.direct_links = {}
+        self.mutual_links = None
+        self.connector_colors = {}
         self.next_entry_id = 1
         self.data_path = os.path.join(os.path.dirname(__file__), "life_notes.json")
         self.heatmap_base_color = QColor("#3b7c7a")
@@ -44,10 +66,30 @@ class MainWindow(
         ]
         self.work_tag_set = {emoji for emoji, _ in self.work_tag_options}
         self.view_mode = "weeks"
+        self.save_scheduled = False
+        self.load_task = None
+        self.load_chunk_size = 2000
+        self.loaded_entry_count = 0
+        self.setup_refresh_scheduler()
+        self.journal_events = JournalEvents(self)
+        for signal in (
+            self.journal_events.entry_added,
+            self.journal_events.entry_changed,
+            self.journal_events.entry_removed,
+            self.journal_events.links_changed,
+        ):
+            signal.connect(self.on_journal_list_event)
+            signal.connect(self.schedule_save)
+        self.journal_events.entry_added.connect(self.on_journal_counts_event)
+        self.journal_events.entry_changed.connect(self.on_journal_counts_event)
+        self.journal_events.entry_removed.connect(self.on_journal_counts_event)
 
         self.setup_ui()
         apply_theme(self)
         self.update_main_color()
         self.update_heatmap_colors()
-        self.load_data()
         self.on_view_changed(self.view_combo.currentIndex())
+
+    def closeEvent(self, event):
+        self.flush_save()
+        super().closeEvent(event)
@@ -1,19 +1,346 @@
+import gc
 import json
 import os
 
-from PySide6.QtCore import QDate, QTime
+from PySide6.QtCore import (
+    QDate,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTime,
+    QTimer,
+    Signal,
+)
+
+from display_rows import (
+    clean_links,
+    entry_preview,
+    is_action_entry,
+    snapshot_week,
+    update_link_tables,
+)
+
+
+def read_journal(path):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    return data
+
+
+def journal_birth_date(data, default):
+    birth_text = data.get("birth_date")
+    if isinstance(birth_text, str):
+        birth_date = QDate.fromString(birth_text, "yyyy-MM-dd")
+        if birth_date.isValid():
+            return birth_date
+    return default
+
+
+def journal_next_entry_id(data, default):
+    stored_next_id = data.get("next_entry_id")
+    if isinstance(stored_next_id, int) and stored_next_id > 0:
+        return stored_next_id
+    return default
+
+
+class JournalParser:
+    def __init__(self, birth_date, next_entry_id):
+        self.birth_date = birth_date
+        self.next_entry_id = next_entry_id
+
+    def week_entry_date(self, week_index):
+        return self.birth_date.addDays(week_index * 7).toString("yyyy-MM-dd")
+
+    def ensure_entry_id(self, entry):
+        entry_id = entry.get("id")
+        if isinstance(entry_id, int) and entry_id > 0:
+            if entry_id >= self.next_entry_id:
+                self.next_entry_id = entry_id + 1
+            return entry_id
+        entry_id = self.next_entry_id
+        self.next_entry_id += 1
+        entry["id"] = entry_id
+        return entry_id
+
+    def clean_entry(self, entry, week_index, default_title):
+        title = str(entry.get("title", "")).strip()
+        desc = str(entry.get("description", "")).strip()
+        if not (title or desc):
+            return None
+        date_text = str(entry.get("date", "")).strip()
+        date_value = QDate.fromString(date_text, "yyyy-MM-dd")
+        if not date_value.isValid():
+            date_text = self.week_entry_date(week_index)
+        time_text = str(entry.get("time", "")).strip()
+        time_value = QTime.fromString(time_text, "HH:mm")
+        if not time_value.isValid():
+            time_text = ""
+        entry_data = {
+            "title": title or default_title,
+            "description": desc,
+            "date": date_text,
+            "time": time_text,
+            "action": entry.get("action") is True,
+            "links": clean_links(entry.get("links")),
+        }
+        if is_action_entry(entry_data):
+            entry_data["action"] = True
+        entry_id = entry.get("id")
+        if isinstance(entry_id, int) and entry_id > 0:
+            entry_data["id"] = entry_id
+        self.ensure_entry_id(entry_data)
+        return entry_data
+
+    def clean_text_entry(self, value, week_index):
+        lines = [line.strip() for line in value.splitlines() if line.strip()]
+        title = lines[0] if lines else "Entrada"
+        desc = "\n".join(lines[1:]) if len(lines) > 1 else ""
+        entry_data = {
+            "title": title,
+            "description": desc,
+            "date": self.week_entry_date(week_index),
+            "time": "",
+            "action": False,
+            "links": [],
+        }
+        self.ensure_entry_id(entry_data)
+        return entry_data
+
+    def iter_weeks(self, notes, default_title, allow_text):
+        for key, value in notes.items():
+            try:
+                week_index = int(key)
+            except (TypeError, ValueError):
+                continue
+            if isinstance(value, list):
+                entries = []
+                for entry in value:
+                    if not isinstance(entry, dict):
+                        continue
+                    entry_data = self.clean_entry(entry, week_index, default_title)
+                    if entry_data is not None:
+                        entries.append(entry_data)
+                if entries:
+                    yield week_index, entries
+            elif allow_text and isinstance(value, str) and value.strip():
+                yield week_index, [self.clean_text_entry(value, week_index)]
+
+
+JOURNAL_SECTIONS = (
+    ("bitacora", "notes", "Entrada", True),
+    ("trabajo", "work_notes", "Bitacora", False),
+)
+
+
+class JournalLoadSignals(QObject):
+    settings_ready = Signal(object)
+    notes_ready = Signal(str, object)
+    finished = Signal(int)
+
+
+class JournalLoadTask(QRunnable):
+    def __init__(self, path, birth_date, next_entry_id, chunk_size):
+        super().__init__()
+        self.path = path
+        self.birth_date = QDate(birth_date)
+        self.next_entry_id = next_entry_id
+        self.chunk_size = chunk_size
+        self.direct_links = {}
+        self.mutual_links = {}
+        self.julian_days = {}
+        self.signals = JournalLoadSignals()
+
+    def run(self):
+        data = read_journal(self.path)
+        if data is None:
+            self.signals.finished.emit(0)
+            return
+        settings = {
+            key: value
+            for key, value in data.items()
+            if key not in ("notes", "work_notes")
+        }
+        self.signals.settings_ready.emit(settings)
+        parser = JournalParser(
+            journal_birth_date(data, self.birth_date),
+            journal_next_entry_id(data, self.next_entry_id),
+        )
+        for view, section, default_title, allow_text in JOURNAL_SECTIONS:
+            notes = data.get(section, {})
+            if not isinstance(notes, dict):
+                continue
+            chunk = self.new_chunk()
+            for week_index, entries in parser.iter_weeks(
+                notes, default_title, allow_text
+            ):
+                self.add_week(chunk, week_index, entries)
+                if len(chunk["previews"]) >= self.chunk_size:
+                    self.signals.notes_ready.emit(view, chunk)
+                    chunk = self.new_chunk()
+            if chunk["notes"]:
+                self.signals.notes_ready.emit(view, chunk)
+        self.signals.finished.emit(parser.next_entry_id)
+
+    def new_chunk(self):
+        return {
+            "notes": {},
+            "previews": {},
+            "snapshots": {},
+            "week_counts": {},
+            "day_counts": {},
+            "direct_links": {},
+            "mutual_changes": {},
+        }
+
+    def add_week(self, chunk, week_index, entries):
+        chunk["notes"][week_index] = entries
+        chunk["snapshots"][week_index] = snapshot_week(week_index, entries, {})
+        chunk["week_counts"][week_index] = len(entries)
+        day_counts = chunk["day_counts"]
+        for entry in entries:
+            entry_id = entry["id"]
+            chunk["previews"][entry_id] = (0, entry_preview(entry))
+            julian_day = self.julian_day(entry["date"])
+            if julian_day is not None:
+                day_counts[julian_day] = day_counts.get(julian_day, 0) + 1
+            self.add_entry_links(chunk, entry_id, entry["links"])
+
+    def add_entry_links(self, chunk, entry_id, links):
+        known = entry_id in self.direct_links
+        if not (known or links):
+            return
+        changes = update_link_tables(
+            self.direct_links, self.mutual_links, entry_id, links
+        )
+        chunk["direct_links"][entry_id] = self.direct_links.get(entry_id, frozenset())
+        mutual_changes = chunk["mutual_changes"]
+        for other_id, (previous, current) in changes.items():
+            if other_id in mutual_changes:
+                previous = mutual_changes[other_id][0]
+            mutual_changes[other_id] = (previous, current)
+
+    def julian_day(self, date_text):
+        if date_text not in self.julian_days:
+            date_value = QDate.fromString(date_text, "yyyy-MM-dd")
+            self.julian_days[date_text] = (
+                date_value.toJulianDay() if date_value.isValid() else None
+            )
+        return self.julian_days[date_text]
 
 
 class PersistenceMixin:
     def load_data(self):
-        if not os.path.exists(self.data_path):
+        data = read_journal(self.data_path)
+        if data is None:
             return
-        try:
-            with open(self.data_path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-        except (OSError, json.JSONDecodeError):
+        self.loading = True
+        self.apply_journal_settings(data)
+        parser = JournalParser(self.life_widget.birth_date, self.next_entry_id)
+        for view, section, default_title, allow_text in JOURNAL_SECTIONS:
+            notes = data.get(section, {})
+            if not isinstance(notes, dict):
+                continue
+            cleaned = dict(parser.iter_weeks(notes, default_title, allow_text))
+            if view == "trabajo":
+                self.work_notes = cleaned
+            else:
+                self.week_notes = cleaned
+        self.next_entry_id = parser.next_entry_id
+        self.counts_cache = {}
+        self.prime_entry_previews()
+        self.invalidate_entry_locations()
+        self.invalidate_link_tables()
+        self.finish_loading()
+
+    def start_loading(self):
+        if self.load_task is not None:
             return
         self.loading = True
+        self.week_notes = {}
+        self.work_notes = {}
+        self.preview_cache = {}
+        self.entry_versions = {}
+        self.week_snapshots = {}
+        self.counts_cache = {}
+        self.invalidate_entry_locations()
+        self.direct_links = {}
+        self.mutual_links = {}
+        self.set_loading_state(True)
+        gc.disable()
+        task = JournalLoadTask(
+            self.data_path,
+            self.life_widget.birth_date,
+            self.next_entry_id,
+            self.load_chunk_size,
+        )
+        task.signals.settings_ready.connect(self.apply_journal_settings)
+        task.signals.notes_ready.connect(self.on_journal_chunk)
+        task.signals.finished.connect(self.on_journal_loaded)
+        self.load_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def on_journal_chunk(self, view, chunk):
+        notes = self.work_notes if view == "trabajo" else self.week_notes
+        notes.update(chunk["notes"])
+        self.preview_cache.update(chunk["previews"])
+        for week_index, rows in chunk["snapshots"].items():
+            self.week_snapshots[(view, week_index)] = (
+                tuple(chunk["notes"][week_index]),
+                rows,
+            )
+        self.merge_chunk_counts(view, chunk["week_counts"], chunk["day_counts"])
+        self.apply_link_changes(chunk["direct_links"], chunk["mutual_changes"])
+        self.loaded_entry_count += len(chunk["previews"])
+        self.loading_label.setText(
+            f"Cargando bitacora... {self.loaded_entry_count} entradas"
+        )
+        locations = self.location_index.get(view)
+        if locations is not None:
+            for week_index, entries in chunk["notes"].items():
+                for entry_index, entry in enumerate(entries):
+                    locations[entry["id"]] = (week_index, entry_index)
+        self.mark_data_changed(view)
+        self.invalidate(entries_list=True, counts=True)
+
+    def merge_chunk_counts(self, view, week_counts, day_counts):
+        loaded_weeks, loaded_days = self.counts_cache.get(view, ({}, {}))
+        loaded_weeks = dict(loaded_weeks)
+        loaded_weeks.update(week_counts)
+        loaded_days = dict(loaded_days)
+        for julian_day, count in day_counts.items():
+            loaded_days[julian_day] = loaded_days.get(julian_day, 0) + count
+        self.counts_cache[view] = (loaded_weeks, loaded_days)
+
+    def on_journal_loaded(self, next_entry_id):
+        self.load_task = None
+        gc.freeze()
+        gc.enable()
+        if next_entry_id > 0:
+            self.next_entry_id = next_entry_id
+        self.finish_loading()
+
+    def finish_loading(self):
+        self.loading = False
+        self.prune_connector_colors()
+        self.set_loading_state(False)
+        self.mark_data_changed()
+        self.invalidate(entries_list=True, counts=True)
+        self.update_main_color()
+
+    def set_loading_state(self, active):
+        self.loaded_entry_count = 0
+        self.loading_label.setText("Cargando bitacora...")
+        self.loading_label.setVisible(active)
+        self.detail_panel.setEnabled(not active)
+
+    def apply_journal_settings(self, data):
         heatmap_color = data.get("heatmap_color")
         if isinstance(heatmap_color, str) and heatmap_color.strip():
             combo_index = self.heatmap_combo.findData(heatmap_color.strip())
@@ -28,125 +355,43 @@ class PersistenceMixin:
         work_heatmap = data.get("heatmap_color_trabajo")
         if isinstance(work_heatmap, str) and work_heatmap.strip():
             self.heatmap_colors_by_view["trabajo"] = work_heatmap.strip()
-        birth_text = data.get("birth_date")
-        if isinstance(birth_text, str):
-            birth_date = QDate.fromString(birth_text, "yyyy-MM-dd")
-            if birth_date.isValid():
-                self.birth_input.setDate(birth_date)
-                self.life_widget.set_birth_date(birth_date)
+        birth_date = journal_birth_date(data, None)
+        if birth_date is not None:
+            self.birth_input.setDate(birth_date)
+            self.life_widget.set_birth_date(birth_date)
         years_value = data.get("years")
         if isinstance(years_value, int):
             self.years_input.setValue(years_value)
             self.life_widget.set_years(years_value)
-        stored_next_id = data.get("next_entry_id")
-        if isinstance(stored_next_id, int) and stored_next_id > 0:
-            self.next_entry_id = stored_next_id
-        notes = data.get("notes", {})
-        if isinstance(notes, dict):
-            cleaned = {}
-            for key, value in notes.items():
-                try:
-                    week_index = int(key)
-                except (TypeError, ValueError):
-                    continue
-                if isinstance(value, list):
-                    entries = []
-                    for entry in value:
-                        if not isinstance(entry, dict):
-                            continue
-                        title = str(entry.get("title", "")).strip()
-                        desc = str(entry.get("description", "")).strip()
-                        date_text = str(entry.get("date", "")).strip()
-                        date_value = QDate.fromString(date_text, "yyyy-MM-dd")
-                        if not date_value.isValid():
-                            date_text = self.week_entry_date(week_index)
-                        time_text = str(entry.get("time", "")).strip()
-                        time_value = QTime.fromString(time_text, "HH:mm")
-                        if not time_value.isValid():
-                            time_text = ""
-                        links = self.clean_links(entry.get("links"))
-                        entry_id = entry.get("id")
-                        if title or desc:
-                            entry_data = {
-                                "title": title or "Entrada",
-                                "description": desc,
-                                "date": date_text,
-                                "time": time_text,
-                                "action": entry.get("action") is True,
-                                "links": links,
-                            }
-                            if self.is_action_entry(entry_data):
-                                entry_data["action"] = True
-                            if isinstance(entry_id, int) and entry_id > 0:
-                                entry_data["id"] = entry_id
-                            self.ensure_entry_id(entry_data)
-                            entries.append(entry_data)
-                    if entries:
-                        cleaned[week_index] = entries
-                elif isinstance(value, str) and value.strip():
-                    lines = [line.strip() for line in value.splitlines() if line.strip()]
-                    title = lines[0] if lines else "Entrada"
-                    desc = "\n".join(lines[1:]) if len(lines) > 1 else ""
-                    entry_data = {
-                        "title": title,
-                        "description": desc,
-                        "date": self.week_entry_date(week_index),
-                        "time": "",
-                        "action": False,
-                        "links": [],
-                    }
-                    self.ensure_entry_id(entry_data)
-                    cleaned[week_index] = [entry_data]
-            self.week_notes = cleaned
-        work_notes = data.get("work_notes", {})
-        if isinstance(work_notes, dict):
-            cleaned_work = {}
-            for key, value in work_notes.items():
-                try:
-                    week_index = int(key)
-                except (TypeError, ValueError):
-                    continue
-                if isinstance(value, list):
-                    entries = []
-                    for entry in value:
-                        if not isinstance(entry, dict):
-                            continue
-                        title = str(entry.get("title", "")).strip()
-                        desc = str(entry.get("description", "")).strip()
-                        date_text = str(entry.get("date", "")).strip()
-                        date_value = QDate.fromString(date_text, "yyyy-MM-dd")
-                        if not date_value.isValid():
-                            date_text = self.week_entry_date(week_index)
-                        time_text = str(entry.get("time", "")).strip()
-                        time_value = QTime.fromString(time_text, "HH:mm")
-                        if not time_value.isValid():
-                            time_text = ""
-                        links = self.clean_links(entry.get("links"))
-                        entry_id = entry.get("id")
-                        if title or desc:
-                            entry_data = {
-                                "title": title or "Bitacora",
-                                "description": desc,
-                                "date": date_text,
-                                "time": time_text,
-                                "action": entry.get("action") is True,
-                                "links": links,
-                            }
-                            if self.is_action_entry(entry_data):
-                                entry_data["action"] = True
-                            if isinstance(entry_id, int) and entry_id > 0:
-                                entry_data["id"] = entry_id
-                            self.ensure_entry_id(entry_data)
-                            entries.append(entry_data)
-                    if entries:
-                        cleaned_work[week_index] = entries
-            self.work_notes = cleaned_work
-        self.loading = False
-        self.refresh_entries_list()
-        self.update_counts()
-        self.update_main_color()
+        connector_colors = data.get("connector_colors", {})
+        if isinstance(connector_colors, dict):
+            self.connector_colors = {}
+            for pair_text, color_index in connector_colors.items():
+                ids = str(pair_text).split("-")
+                if (
+                    len(ids) == 2
+                    and all(value.isdigit() for value in ids)
+                    and isinstance(color_index, int)
+                ):
+                    pair = (int(ids[0]), int(ids[1]))
+                    self.connector_colors[pair] = color_index
+        self.next_entry_id = journal_next_entry_id(data, self.next_entry_id)
+
+    def schedule_save(self, *details):
+        if self.save_scheduled:
+            return
+        self.save_scheduled = True
+        QTimer.singleShot(0, self.flush_save)
+
+    def flush_save(self):
+        if not self.save_scheduled:
+            return
+        self.save_scheduled = False
+        self.save_data()
 
     def save_data(self):
+        if self.loading:
+            return
         data = {
             "birth_date": self.birth_input.date().toString("yyyy-MM-dd"),
             "years": self.years_input.value(),
@@ -154,6 +399,10 @@ class PersistenceMixin:
             "heatmap_color": self.heatmap_colors_by_view.get("bitacora"),
             "heatmap_color_trabajo": self.heatmap_colors_by_view.get("trabajo"),
             "main_color": self.main_color_combo.currentData(),
+            "connector_colors": {
+                f"{a_id}-{b_id}": color_index
+                for (a_id, b_id), color_index in self.connector_colors.items()
+            },
             "notes": {str(k): v for k, v in self.week_notes.items()},
             "work_notes": {str(k): v for k, v in self.work_notes.items()},
         }
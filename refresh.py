@@ -0,0 +1,112 @@
+from collections import Counter
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+from display_rows import compute_display_rows
+
+
+class DisplayRowsSignals(QObject):
+    finished = Signal(int, object, object)
+
+
+class DisplayRowsTask(QRunnable):
+    def __init__(self, generation, key, snapshot):
+        super().__init__()
+        self.generation = generation
+        self.key = key
+        self.snapshot = snapshot
+        self.signals = DisplayRowsSignals()
+
+    def run(self):
+        result = compute_display_rows(self.snapshot)
+        self.signals.finished.emit(self.generation, self.key, result)
+
+
+class RefreshSchedulerMixin:
+    def setup_refresh_scheduler(self):
+        self.dirty_parts = set()
+        self.pending_selection = None
+        self.refresh_scheduled = False
+        self.refresh_counters = Counter()
+        self.flush_work = Counter()
+        self.max_flush_work = Counter()
+        self.display_rows_generation = 0
+        self.display_rows_task = None
+
+    def invalidate(self, entries_list=False, counts=False, heatmap=False):
+        if entries_list:
+            self.dirty_parts.add("list")
+        if counts:
+            self.dirty_parts.add("counts")
+        if heatmap:
+            self.dirty_parts.add("heatmap")
+        self.schedule_flush()
+
+    def request_selection(self, entry_id):
+        self.pending_selection = (entry_id,)
+        self.current_entry_id = entry_id
+        self.schedule_flush()
+
+    def schedule_flush(self):
+        if self.refresh_scheduled:
+            return
+        self.refresh_scheduled = True
+        QTimer.singleShot(0, self.flush_refresh)
+
+    def flush_refresh(self):
+        self.refresh_scheduled = False
+        dirty = self.dirty_parts
+        selection = self.pending_selection
+        self.dirty_parts = set()
+        self.pending_selection = None
+        self.flush_work = Counter()
+        if "heatmap" in dirty:
+            self.update_heatmap_colors()
+        if "counts" in dirty and self.life_widget.entries_mode:
+            self.update_counts()
+        if "list" in dirty:
+            self.refresh_entries_list()
+        if selection is not None:
+            if self.display_rows_task is not None:
+                self.current_entry_id = selection[0]
+            else:
+                self.select_entry_id(*selection)
+        self.refresh_counters["flush"] += 1
+        for part, count in self.flush_work.items():
+            self.max_flush_work[part] = max(self.max_flush_work[part], count)
+
+    def count_refresh(self, part):
+        self.refresh_counters[part] += 1
+        self.flush_work[part] += 1
+
+    def start_display_rows_task(self, key):
+        self.display_rows_generation += 1
+        if self.display_rows_task is not None:
+            return
+        snapshot = self.display_rows_snapshot(self.current_week)
+        snapshot["mutual_links"] = dict(snapshot["mutual_links"])
+        snapshot["pair_colors"] = dict(snapshot["pair_colors"])
+        task = DisplayRowsTask(self.display_rows_generation, key, snapshot)
+        task.signals.finished.connect(self.on_display_rows_ready)
+        self.display_rows_task = task
+        self.set_rows_pending(True)
+        self.refresh_counters["rows_background"] += 1
+        QThreadPool.globalInstance().start(task)
+
+    def set_rows_pending(self, active):
+        if not self.loading:
+            self.loading_label.setText("Actualizando lista...")
+            self.loading_label.setVisible(active)
+
+    def on_display_rows_ready(self, generation, key, result):
+        self.display_rows_task = None
+        specs, row_by_entry_id, previews = result
+        self.merge_previews(previews)
+        current = key == self.display_rows_key(self.current_week)
+        if current:
+            self.store_display_rows(key, (specs, row_by_entry_id))
+        else:
+            self.refresh_counters["rows_discarded"] += 1
+        if current or generation != self.display_rows_generation:
+            self.invalidate(entries_list=True)
+            self.request_selection(self.current_entry_id)
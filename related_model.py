@@ -0,0 +1,125 @@
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QObject, Qt
+
+
+class RelatedNode:
+    def __init__(self, entry_id, parent=None, row=0):
+        self.entry_id = entry_id
+        self.parent = parent
+        self.row = row
+        self.children = None
+        self.followups = None
+
+    def ancestor_ids(self):
+        ids = set()
+        node = self
+        while node is not None and node.entry_id is not None:
+            ids.add(node.entry_id)
+            node = node.parent
+        return ids
+
+
+class RelatedEntriesModel(QAbstractItemModel):
+    def __init__(self, resolve_labels, followup_ids, parent=None):
+        super().__init__(parent)
+        self.resolve_labels = resolve_labels
+        self.followup_ids = followup_ids
+        self.root = RelatedNode(None)
+        self.root.children = []
+        self.labels = {}
+
+    def set_entry_ids(self, entry_ids):
+        self.beginResetModel()
+        self.root = RelatedNode(None)
+        self.root.children = [
+            RelatedNode(entry_id, self.root, row)
+            for row, entry_id in enumerate(entry_ids)
+        ]
+        self.labels = {}
+        self.endResetModel()
+
+    def node(self, index):
+        if index.isValid():
+            return index.internalPointer()
+        return self.root
+
+    def node_followups(self, node):
+        if node.followups is None:
+            ancestors = node.ancestor_ids()
+            node.followups = [
+                entry_id
+                for entry_id in self.followup_ids(node.entry_id)
+                if entry_id not in ancestors
+            ]
+        return node.followups
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = self.node(parent)
+        if column != 0 or node.children is None:
+            return QModelIndex()
+        if not 0 <= row < len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index=None):
+        if index is None:
+            return QObject.parent(self)
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer().parent
+        if node is None or node is self.root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        node = self.node(parent)
+        return len(node.children) if node.children is not None else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.node(parent)
+        if node is self.root:
+            return bool(node.children)
+        if node.children is not None:
+            return bool(node.children)
+        return bool(self.node_followups(node))
+
+    def canFetchMore(self, parent):
+        node = self.node(parent)
+        return node is not self.root and node.children is None
+
+    def fetchMore(self, parent):
+        node = self.node(parent)
+        if node is self.root or node.children is not None:
+            return
+        followups = self.node_followups(node)
+        if not followups:
+            node.children = []
+            return
+        self.beginInsertRows(parent, 0, len(followups) - 1)
+        node.children = [
+            RelatedNode(entry_id, node, row) for row, entry_id in enumerate(followups)
+        ]
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.UserRole:
+            return node.entry_id
+        if role != Qt.DisplayRole:
+            return None
+        if node.entry_id not in self.labels:
+            siblings = [
+                sibling.entry_id
+                for sibling in node.parent.children
+                if sibling.entry_id not in self.labels
+            ]
+            resolved = self.resolve_labels(siblings)
+            for entry_id in siblings:
+                self.labels[entry_id] = resolved.get(entry_id, "")
+        return self.labels[node.entry_id]
@@ -0,0 +1,126 @@
+import os
+import shutil
+import tempfile
+import unittest
+from collections import Counter
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from journal_generator import write_journal
+from main_window import MainWindow
+
+
+class RefreshCoalescingTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix="bitacora-test-")
+        path = os.path.join(self.workdir, "journal.json")
+        write_journal(path, 400)
+        self.window = MainWindow()
+        self.window.data_path = path
+        self.window.load_data()
+        self.window.show()
+        self.drain()
+        self.busiest = max(
+            self.window.week_notes, key=lambda week: len(self.window.week_notes[week])
+        )
+
+    def tearDown(self):
+        self.window.close()
+        self.window.deleteLater()
+        self.drain()
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def drain(self):
+        for _ in range(10):
+            self.app.processEvents()
+
+    def refreshes(self, action):
+        before = Counter(self.window.refresh_counters)
+        action()
+        self.drain()
+        delta = Counter(self.window.refresh_counters)
+        delta.subtract(before)
+        return delta
+
+    def assertSingleRebuild(self, action, rebuilds=1):
+        delta = self.refreshes(action)
+        self.assertEqual(delta["list"], rebuilds)
+        self.assertLessEqual(delta["counts"], 1)
+        self.assertLessEqual(delta["heatmap"], 1)
+
+    def select_busiest_week(self):
+        self.window.life_widget.select_week(self.busiest)
+        self.drain()
+
+    def test_week_select_rebuilds_once(self):
+        self.assertSingleRebuild(
+            lambda: self.window.life_widget.select_week(self.busiest)
+        )
+
+    def test_entry_select_does_not_rebuild(self):
+        self.select_busiest_week()
+        entry = self.window.week_notes[self.busiest][-1]
+        delta = self.refreshes(lambda: self.window.request_selection(entry["id"]))
+        self.assertEqual(delta["list"], 0)
+        self.assertEqual(self.window.current_entry_id, entry["id"])
+
+    def test_save_rebuilds_once(self):
+        self.select_busiest_week()
+        self.window.title_input.setText("Titulo cambiado")
+        self.assertSingleRebuild(self.window.save_entry)
+
+    def test_create_rebuilds_once(self):
+        self.select_busiest_week()
+        self.assertSingleRebuild(self.window.create_entry)
+
+    def test_delete_rebuilds_once(self):
+        self.select_busiest_week()
+        self.assertSingleRebuild(self.window.delete_entry)
+
+    def test_related_click_rebuilds_once(self):
+        self.window.tabs.setCurrentIndex(1)
+        self.drain()
+        linked = next(
+            spec[1]
+            for spec in self.window.all_display_specs
+            if self.window.find_entry_by_id(spec[1])[2]["links"]
+        )
+        self.window.select_entry_id(linked)
+        self.drain()
+        index = self.window.related_model.index(0, 0)
+        target = index.data(Qt.UserRole)
+        self.assertSingleRebuild(lambda: self.window.on_related_clicked(index), 0)
+        self.assertEqual(self.window.current_entry_id, target)
+
+    def test_related_click_across_weeks_rebuilds_once(self):
+        window = self.window
+        source_week, source, target = next(
+            (week, entry, link_id)
+            for week, entries in window.week_notes.items()
+            for entry in entries
+            for link_id in entry["links"]
+            if window.find_entry_by_id(link_id)
+            and window.find_entry_by_id(link_id)[0] != week
+        )
+        window.life_widget.select_week(source_week)
+        window.request_selection(source["id"])
+        self.drain()
+        related_ids = [node.entry_id for node in window.related_model.root.children]
+        index = window.related_model.index(related_ids.index(target), 0)
+        self.assertSingleRebuild(lambda: window.on_related_clicked(index))
+        self.assertEqual(window.current_entry_id, target)
+
+    def test_tab_change_rebuilds_once(self):
+        self.select_busiest_week()
+        self.assertSingleRebuild(lambda: self.window.tabs.setCurrentIndex(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
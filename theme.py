@@ -26,7 +26,7 @@ def apply_theme(window):
         "  padding: 6px 8px;"
         "  min-height: 28px;"
         "}"
-        "QListWidget {"
+        "QListWidget, QTreeView {"
         "  background: #ffffff;"
         "  border: 1px solid #1f1f1f;"
         "  border-radius: 6px;"
@@ -43,7 +43,8 @@ def apply_theme(window):
         "QPushButton:pressed {"
         "  background: #000000;"
         "}"
-        "QComboBox:hover, QLineEdit:hover, QTextEdit:hover, QListWidget:hover {"
+        "QComboBox:hover, QLineEdit:hover, QTextEdit:hover, QListWidget:hover,"
+        " QTreeView:hover {"
         "  border: 1px solid #6b655c;"
         "}"
     )
@@ -65,7 +66,7 @@ def apply_theme(window):
         "  padding: 6px 8px;"
         "  min-height: 28px;"
         "}"
-        "QListWidget {"
+        "QListWidget, QTreeView {"
         "  background: #ffffff;"
         "  border: none;"
         "}"
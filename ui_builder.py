@@ -17,9 +17,11 @@ from PySide6.QtWidgets import (
     QWidget,
     QScrollArea,
     QTabWidget,
+    QTreeView,
 )
 
 from bitacorasolo import BitacoraSoloTab
+from related_model import RelatedEntriesModel
 from widgets import LifeWeeksWidget
 
 
@@ -189,6 +191,10 @@ class UiBuilderMixin:
         notes_layout.addWidget(self.filter_row)
         notes_layout.addWidget(self.collapse_row)
         notes_layout.addWidget(notes_list_label)
+        self.loading_label = QLabel("Cargando bitacora...", self.notes_panel)
+        self.loading_label.setStyleSheet("color: #6b655c;")
+        self.loading_label.setVisible(False)
+        notes_layout.addWidget(self.loading_label)
 
         entries_layout = QHBoxLayout()
         entries_layout.setSpacing(14)
@@ -197,6 +203,7 @@ class UiBuilderMixin:
         entries_layout.addWidget(self.notes_list, 1)
 
         detail_panel = QFrame(self.notes_panel)
+        self.detail_panel = detail_panel
         detail_panel.setObjectName("detailPanel")
         detail_panel.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         detail_layout = QVBoxLayout(detail_panel)
@@ -235,8 +242,13 @@ class UiBuilderMixin:
 
         related_label = QLabel("Relacionadas", detail_panel)
         related_label.setObjectName("detailLabel")
-        self.related_list = QListWidget(detail_panel)
-        self.related_list.setSpacing(6)
+        self.related_model = RelatedEntriesModel(
+            self.related_labels, self.followup_ids, detail_panel
+        )
+        self.related_list = QTreeView(detail_panel)
+        self.related_list.setModel(self.related_model)
+        self.related_list.setHeaderHidden(True)
+        self.related_list.setUniformRowHeights(True)
         self.related_list.setMinimumHeight(90)
 
         buttons_layout = QHBoxLayout()
@@ -325,12 +337,16 @@ class UiBuilderMixin:
         self.view_combo.currentIndexChanged.connect(self.on_view_changed)
         self.heatmap_combo.currentIndexChanged.connect(self.on_heatmap_color_changed)
         self.life_widget.weekSelected.connect(self.on_week_selected)
+        self.life_widget.viewModeChanged.connect(self.on_heatmap_mode_changed)
         self.new_button.clicked.connect(self.create_entry)
         self.save_button.clicked.connect(self.save_entry)
         self.followup_button.clicked.connect(self.create_followup_entry)
         self.delete_button.clicked.connect(self.delete_entry)
         self.notes_list.currentItemChanged.connect(self.on_entry_selected)
-        self.related_list.itemClicked.connect(self.on_related_clicked)
+        self.notes_list.verticalScrollBar().valueChanged.connect(
+            self.on_notes_scrolled
+        )
+        self.related_list.clicked.connect(self.on_related_clicked)
         self.mode_button.clicked.connect(self.toggle_heatmap_mode)
         self.main_color_combo.currentIndexChanged.connect(
             self.on_main_color_changed
@@ -1,5 +1,27 @@
-from PySide6.QtCore import QDate, QRectF, QSize, Qt, Signal
-from PySide6.QtGui import QColor, QFont, QPainter, QPen
+from bisect import bisect_right
+
+from PySide6.QtCore import (
+    QDate,
+    QEvent,
+    QPointF,
+    QRect,
+    QRectF,
+    QSize,
+    QSizeF,
+    Qt,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QFontMetricsF,
+    QImage,
+    QPainter,
+    QPen,
+    QPixmap,
+    QStaticText,
+)
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -10,9 +32,12 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from display_rows import split_title_emoji
+
 
 class LifeWeeksWidget(QWidget):
     weekSelected = Signal(int)
+    viewModeChanged = Signal(str)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -42,83 +67,177 @@ class LifeWeeksWidget(QWidget):
         self.day_counts = {}
         self.heatmap_colors = []
         self.view_mode = "weeks"
+        self.grid_cache = None
+        self.grid_cache_rows = set()
+        self.cell_rect_rows = None
+        self.border_tile = None
+        self.max_incremental_cells = 64
+        self.life_columns = 366
+        self.life_block_width = 2
+        self.life_block_height = 6
+        self.life_image = None
+        self.life_pixmap = None
+        self.zoom_levels = ("years", "months", "weeks", "life")
+        self.years_per_row = 10
+        self.period_start_cache = {}
+        self.period_count_cache = {}
+        self.zoom_gesture_delta = 0.0
+        self.paint_resources = None
+        self.label_layout = None
+        self.defer_week_signal = False
+        self.key_week_step = None
+        self.week_signal_timer = QTimer(self)
+        self.week_signal_timer.setSingleShot(True)
+        self.week_signal_timer.setInterval(150)
+        self.week_signal_timer.timeout.connect(self.emit_selected_week)
 
         self.setFocusPolicy(Qt.StrongFocus)
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
 
     def sizeHint(self):
-        if self.view_mode == "days":
+        if self.view_mode == "life":
             width = (
                 self.left_gutter
                 + self.right_gutter
-                + self.day_cols * (self.cell + self.gap)
-                - self.gap
+                + self.life_columns * self.life_block_width
             )
             height = (
                 self.top_gutter
                 + self.bottom_gutter
-                + self.day_rows * (self.cell + self.gap)
-                - self.gap
+                + self.years * self.life_block_height
             )
         else:
             width = (
                 self.left_gutter
                 + self.right_gutter
-                + self.weeks_per_year * (self.cell + self.gap)
+                + self.grid_columns() * (self.cell + self.gap)
                 - self.gap
             )
             height = (
                 self.top_gutter
                 + self.bottom_gutter
-                + self.years * (self.cell + self.gap)
+                + self.grid_rows() * (self.cell + self.gap)
                 - self.gap
             )
         return QSize(width, height)
 
     def set_birth_date(self, date_value):
         self.birth_date = date_value
-        self.update()
+        self.label_layout = None
+        self.invalidate_periods()
+        self.invalidate_life_image()
+        self.invalidate_grid_cache()
 
     def set_years(self, years_value):
         self.years = years_value
         self.updateGeometry()
-        self.update()
+        self.resize(self.sizeHint())
+        self.invalidate_geometry()
 
     def set_cell_size(self, cell, gap):
         self.cell = cell
         self.gap = gap
         self.updateGeometry()
-        self.update()
+        self.resize(self.sizeHint())
+        self.invalidate_geometry()
 
     def set_view_mode(self, mode):
-        if mode not in ("weeks", "days"):
+        if mode not in ("years", "months", "weeks", "days", "life"):
             return
         self.view_mode = mode
-        if self.view_mode == "days":
+        if self.is_daily_mode():
             self.ensure_selected_date()
         self.updateGeometry()
-        self.update()
+        self.resize(self.sizeHint())
+        self.invalidate_geometry()
+
+    def zoom_by(self, step):
+        mode = self.view_mode if self.view_mode in self.zoom_levels else "life"
+        index = self.zoom_levels.index(mode) + step
+        index = max(0, min(len(self.zoom_levels) - 1, index))
+        mode = self.zoom_levels[index]
+        if mode == self.view_mode:
+            return
+        self.set_view_mode(mode)
+        self.viewModeChanged.emit(mode)
 
     def set_entries_mode(self, enabled):
+        if enabled != self.entries_mode:
+            self.invalidate_grid_cache()
         self.entries_mode = enabled
+        self.apply_life_palette()
         if enabled and self.selected_week is None:
             self.selected_week = self.weeks_lived()
             self.weekSelected.emit(self.selected_week)
-        if enabled and self.view_mode == "days":
+            self.update_week_cell(self.selected_week)
+        if enabled and self.is_daily_mode():
+            previous_date = self.selected_date
             self.ensure_selected_date()
-        self.update()
+            if self.selected_date != previous_date:
+                self.update_day_cell(previous_date)
+                self.update_day_cell(self.selected_date)
 
     def set_week_counts(self, counts):
+        previous = self.week_counts
         self.week_counts = counts or {}
-        self.update()
+        if not self.entries_mode or self.view_mode != "weeks":
+            return
+        max_index = self.years * self.weeks_per_year
+        self.repaint_changed_cells(
+            [
+                (index % self.weeks_per_year, index // self.weeks_per_year)
+                for index in previous.keys() | self.week_counts.keys()
+                if previous.get(index) != self.week_counts.get(index)
+                and 0 <= index < max_index
+            ]
+        )
 
     def set_day_counts(self, counts):
+        previous = self.day_counts
         self.day_counts = counts or {}
-        self.update()
+        self.period_count_cache = {}
+        if self.view_mode == "life":
+            self.update_life_pixels(previous)
+            return
+        self.life_image = None
+        if self.is_period_mode():
+            if not self.entries_mode:
+                return
+            cells = set()
+            for julian_day in previous.keys() | self.day_counts.keys():
+                if previous.get(julian_day) == self.day_counts.get(julian_day):
+                    continue
+                index = self.period_index_for_day(julian_day)
+                if index is not None:
+                    cells.add(self.period_cell(index))
+            self.repaint_changed_cells(list(cells))
+            return
+        if not self.entries_mode or self.view_mode != "days":
+            return
+        start_day = self.daily_start_date().toJulianDay()
+        total_days = self.day_cols * self.day_rows
+        cells = []
+        for julian_day in previous.keys() | self.day_counts.keys():
+            if previous.get(julian_day) == self.day_counts.get(julian_day):
+                continue
+            index = julian_day - start_day
+            if 0 <= index < total_days:
+                cells.append((index // self.day_rows, index % self.day_rows))
+        self.repaint_changed_cells(cells)
+
+    def repaint_changed_cells(self, cells):
+        if not cells:
+            return
+        if len(cells) > self.max_incremental_cells:
+            self.invalidate_grid_cache()
+            return
+        self.repaint_cached_cells(cells)
 
     def set_heatmap_colors(self, colors):
         self.heatmap_colors = colors or []
-        self.update()
+        self.apply_life_palette()
+        if self.entries_mode:
+            self.invalidate_grid_cache()
 
     def set_main_color(self, color_value):
         if not color_value:
@@ -128,7 +247,9 @@ class LifeWeeksWidget(QWidget):
             return
         self.color_lived = base
         self.color_current = base.darker(140)
-        self.update()
+        self.paint_resources = None
+        self.apply_life_palette()
+        self.invalidate_grid_cache()
 
     def select_week(self, week_index):
         if week_index is None:
@@ -136,9 +257,15 @@ class LifeWeeksWidget(QWidget):
         max_index = self.years * self.weeks_per_year - 1
         if week_index < 0 or week_index > max_index:
             return
+        previous_week = self.selected_week
         self.selected_week = week_index
-        self.weekSelected.emit(week_index)
-        self.update()
+        if self.defer_week_signal:
+            self.week_signal_timer.start()
+        else:
+            self.week_signal_timer.stop()
+            self.weekSelected.emit(week_index)
+        self.update_week_cell(previous_week)
+        self.update_week_cell(week_index)
 
     def weeks_lived(self):
         if self.birth_date > self.today:
@@ -152,9 +279,14 @@ class LifeWeeksWidget(QWidget):
             return max_weeks
         return weeks
 
+    def is_daily_mode(self):
+        return self.view_mode in ("days", "life")
+
+    def is_period_mode(self):
+        return self.view_mode in ("years", "months")
+
     def ensure_selected_date(self):
-        start_date = self.daily_start_date()
-        end_date = self.daily_end_date()
+        start_date, end_date = self.daily_range()
         if (
             self.selected_date is None
             or not self.selected_date.isValid()
@@ -169,14 +301,20 @@ class LifeWeeksWidget(QWidget):
     def select_date(self, date_value):
         if date_value is None or not date_value.isValid():
             return
-        start_date = self.daily_start_date()
-        end_date = self.daily_end_date()
+        start_date, end_date = self.daily_range()
         if date_value < start_date or date_value > end_date:
             return
         if date_value > self.today:
             return
+        previous_date = self.selected_date
         self.selected_date = date_value
-        self.update()
+        self.update_day_cell(previous_date)
+        self.update_day_cell(date_value)
+
+    def daily_range(self):
+        if self.view_mode == "life":
+            return self.birth_date, self.today
+        return self.daily_start_date(), self.daily_end_date()
 
     def daily_end_date(self):
         days_to_end = 7 - self.today.dayOfWeek()
@@ -187,6 +325,8 @@ class LifeWeeksWidget(QWidget):
         return self.daily_end_date().addDays(-(total_days - 1))
 
     def week_at(self, pos):
+        if self.view_mode != "weeks":
+            return self.week_index_for_date(self.day_at(pos))
         x = pos.x() - self.left_gutter
         y = pos.y() - self.top_gutter
         if x < 0 or y < 0:
@@ -200,6 +340,15 @@ class LifeWeeksWidget(QWidget):
         return row * self.weeks_per_year + col
 
     def day_at(self, pos):
+        if self.view_mode == "life":
+            return self.life_day_at(pos)
+        if self.is_period_mode():
+            return self.period_day_at(pos)
+        if self.view_mode == "weeks":
+            week_index = self.week_at(pos)
+            if week_index is None:
+                return None
+            return self.birth_date.addDays(week_index * 7)
         x = pos.x() - self.left_gutter
         y = pos.y() - self.top_gutter
         if x < 0 or y < 0:
@@ -243,7 +392,12 @@ class LifeWeeksWidget(QWidget):
             return
         self.setFocus()
         pos = event.position() if hasattr(event, "position") else event.pos()
-        if self.view_mode == "days":
+        if self.is_period_mode():
+            date_value = self.day_at(pos)
+            if date_value is not None:
+                self.select_period(date_value)
+                return
+        elif self.is_daily_mode():
             date_value = self.day_at(pos)
             if date_value is not None:
                 if date_value > self.today:
@@ -260,10 +414,57 @@ class LifeWeeksWidget(QWidget):
                 return
         super().mousePressEvent(event)
 
+    def emit_selected_week(self):
+        if self.selected_week is not None:
+            self.weekSelected.emit(self.selected_week)
+
+    def keyReleaseEvent(self, event):
+        if not event.isAutoRepeat() and self.week_signal_timer.isActive():
+            self.week_signal_timer.stop()
+            self.emit_selected_week()
+        super().keyReleaseEvent(event)
+
     def keyPressEvent(self, event):
+        previous_week = self.selected_week
+        self.defer_week_signal = event.isAutoRepeat()
+        self.move_selection(event)
+        self.defer_week_signal = False
+        if previous_week is not None and self.selected_week != previous_week:
+            self.key_week_step = self.selected_week - previous_week
+
+    def take_key_week_step(self):
+        step = self.key_week_step
+        self.key_week_step = None
+        return step
+
+    def move_selection(self, event):
         if not self.entries_mode:
             super().keyPressEvent(event)
             return
+        if self.is_period_mode():
+            self.move_period_selection(event)
+            return
+        if self.view_mode == "life":
+            self.ensure_selected_date()
+            key = event.key()
+            if key == Qt.Key_Left:
+                date_value = self.selected_date.addDays(-1)
+            elif key == Qt.Key_Right:
+                date_value = self.selected_date.addDays(1)
+            elif key == Qt.Key_Up:
+                date_value = self.selected_date.addYears(-1)
+            elif key == Qt.Key_Down:
+                date_value = self.selected_date.addYears(1)
+            else:
+                super().keyPressEvent(event)
+                return
+            if date_value < self.birth_date or date_value > self.today:
+                return
+            self.select_date(date_value)
+            week_index = self.week_index_for_date(date_value)
+            if week_index is not None:
+                self.select_week(week_index)
+            return
         if self.view_mode == "days":
             self.ensure_selected_date()
             index = self.day_index_for_date(self.selected_date)
@@ -311,122 +512,773 @@ class LifeWeeksWidget(QWidget):
             return
         self.select_week(row * self.weeks_per_year + col)
 
-    def paintEvent(self, event):
-        super().paintEvent(event)
+    def wheelEvent(self, event):
+        delta = event.angleDelta().y()
+        if event.modifiers() & Qt.ControlModifier and delta:
+            self.zoom_by(1 if delta > 0 else -1)
+            event.accept()
+            return
+        super().wheelEvent(event)
+
+    def event(self, event):
+        if (
+            event.type() == QEvent.NativeGesture
+            and event.gestureType() == Qt.ZoomNativeGesture
+        ):
+            self.zoom_gesture_delta += event.value()
+            if abs(self.zoom_gesture_delta) >= 0.25:
+                self.zoom_by(1 if self.zoom_gesture_delta > 0 else -1)
+                self.zoom_gesture_delta = 0.0
+            return True
+        if event.type() == QEvent.DevicePixelRatioChange:
+            self.paint_resources = None
+            self.label_layout = None
+            self.invalidate_geometry()
+        return super().event(event)
+
+    def select_period(self, date_value):
+        week_index = self.week_index_for_date(date_value)
+        if week_index is None or week_index >= self.years * self.weeks_per_year:
+            return
+        previous_date = self.selected_date
+        self.selected_date = date_value
+        self.update_day_cell(previous_date)
+        self.select_week(week_index)
+
+    def move_period_selection(self, event):
+        anchor = self.selected_period_date()
+        if anchor is None:
+            self.select_week(self.weeks_lived())
+            return
+        index = self.period_index_for_day(anchor.toJulianDay())
+        if index is None:
+            return
+        columns = self.grid_columns()
+        key = event.key()
+        if key == Qt.Key_Left and index % columns > 0:
+            index -= 1
+        elif key == Qt.Key_Right and index % columns < columns - 1:
+            index += 1
+        elif key == Qt.Key_Up:
+            index -= columns
+        elif key == Qt.Key_Down:
+            index += columns
+        elif key not in (Qt.Key_Left, Qt.Key_Right):
+            super().keyPressEvent(event)
+            return
+        starts = self.period_starts()
+        if 0 <= index < len(starts) - 1:
+            self.select_period(QDate.fromJulianDay(starts[index]))
+
+    def selected_period_date(self):
+        if self.selected_week is None:
+            return None
+        if (
+            self.selected_date is not None
+            and self.selected_date.isValid()
+            and self.week_index_for_date(self.selected_date) == self.selected_week
+        ):
+            return self.selected_date
+        return self.birth_date.addDays(self.selected_week * 7)
+
+    def selection_rect(self):
+        if self.view_mode == "life":
+            cell = self.life_cell(self.selected_date)
+            return None if cell is None else self.life_update_rect(*cell)
+        if self.is_period_mode():
+            cell = self.period_cell_for_date(self.selected_period_date())
+        elif self.view_mode == "days":
+            cell = self.day_cell(self.selected_date)
+        else:
+            cell = self.week_cell(self.selected_week)
+        return None if cell is None else self.cell_update_rect(*cell)
+
+    def invalidate_periods(self):
+        self.period_start_cache = {}
+        self.period_count_cache = {}
+
+    def period_starts(self, mode=None):
+        mode = mode or self.view_mode
+        starts = self.period_start_cache.get(mode)
+        if starts is None:
+            if mode == "months":
+                starts = [
+                    self.birth_date.addMonths(month).toJulianDay()
+                    for month in range(self.years * 12 + 1)
+                ]
+            else:
+                starts = [
+                    self.birth_date.addYears(year).toJulianDay()
+                    for year in range(self.years + 1)
+                ]
+            self.period_start_cache[mode] = starts
+        return starts
+
+    def period_index_for_day(self, julian_day, mode=None):
+        starts = self.period_starts(mode)
+        if julian_day < starts[0] or julian_day >= starts[-1]:
+            return None
+        return bisect_right(starts, julian_day) - 1
+
+    def period_cell(self, index):
+        columns = self.grid_columns()
+        return index % columns, index // columns
+
+    def period_cell_for_date(self, date_value):
+        if date_value is None or not date_value.isValid():
+            return None
+        index = self.period_index_for_day(date_value.toJulianDay())
+        if index is None:
+            return None
+        return self.period_cell(index)
+
+    def period_day_at(self, pos):
+        x = pos.x() - self.left_gutter
+        y = pos.y() - self.top_gutter
+        if x < 0 or y < 0:
+            return None
+        col = int(x // (self.cell + self.gap))
+        row = int(y // (self.cell + self.gap))
+        if col >= self.grid_columns():
+            return None
+        index = row * self.grid_columns() + col
+        starts = self.period_starts()
+        if index >= len(starts) - 1:
+            return None
+        return QDate.fromJulianDay(starts[index])
+
+    def period_counts(self):
+        counts = self.period_count_cache.get(self.view_mode)
+        if counts is None:
+            counts = {}
+            for julian_day, count in self.day_counts.items():
+                index = self.period_index_for_day(julian_day)
+                if index is not None:
+                    counts[index] = counts.get(index, 0) + count
+            self.period_count_cache[self.view_mode] = counts
+        return counts
+
+    def periods_lived(self):
+        starts = self.period_starts()
+        today_day = self.today.toJulianDay()
+        if today_day < starts[0]:
+            return 0
+        if today_day >= starts[-1]:
+            return len(starts) - 1
+        return bisect_right(starts, today_day) - 1
+
+    def period_cell_color(self, index, periods_lived):
+        if self.entries_mode and self.heatmap_colors:
+            return self.heatmap_tone(self.period_counts().get(index, 0))
+        if index < periods_lived:
+            return self.color_lived
+        if index == periods_lived:
+            return self.color_future
+        return None
+
+    def row_cell_count(self, row):
+        columns = self.grid_columns()
+        if self.is_period_mode():
+            return max(0, min(columns, len(self.period_starts()) - 1 - row * columns))
+        return columns
+
+    def invalidate_grid_cache(self):
+        self.grid_cache = None
+        self.update()
+
+    def cell_rect(self, col, row):
+        x = self.left_gutter + col * (self.cell + self.gap)
+        y = self.top_gutter + row * (self.cell + self.gap)
+        return QRectF(x, y, self.cell, self.cell)
+
+    def cell_update_rect(self, col, row):
+        return self.cell_rect(col, row).toAlignedRect().adjusted(-1, -1, 1, 1)
+
+    def week_cell(self, week_index):
+        if week_index is None:
+            return None
+        if week_index < 0 or week_index >= self.years * self.weeks_per_year:
+            return None
+        return week_index % self.weeks_per_year, week_index // self.weeks_per_year
+
+    def day_cell(self, date_value):
+        index = self.day_index_for_date(date_value)
+        if index is None:
+            return None
+        return index // self.day_rows, index % self.day_rows
+
+    def update_week_cell(self, week_index):
+        if self.is_period_mode():
+            if week_index is not None:
+                week_start = self.birth_date.addDays(week_index * 7)
+                self.update_day_cell(week_start)
+                self.update_day_cell(week_start.addDays(6))
+            return
+        cell = self.week_cell(week_index)
+        if cell is not None and self.view_mode == "weeks":
+            self.update(self.cell_update_rect(*cell))
+
+    def update_day_cell(self, date_value):
+        if self.is_period_mode():
+            cell = self.period_cell_for_date(date_value)
+            if cell is not None:
+                self.update(self.cell_update_rect(*cell))
+            return
+        if self.view_mode == "life":
+            cell = self.life_cell(date_value)
+            if cell is not None:
+                self.update(self.life_update_rect(*cell))
+            return
+        cell = self.day_cell(date_value)
+        if cell is not None and self.view_mode == "days":
+            self.update(self.cell_update_rect(*cell))
+
+    def grid_rows(self):
         if self.view_mode == "days":
-            self.paint_daily()
+            return self.day_rows
+        if self.view_mode == "years":
+            return -(-self.years // self.years_per_row)
+        return self.years
+
+    def rows_in_rect(self, rect):
+        pitch = self.cell + self.gap
+        first = max(0, (rect.top() - self.top_gutter) // pitch)
+        last = min(self.grid_rows() - 1, (rect.bottom() - self.top_gutter) // pitch)
+        return range(first, last + 1)
+
+    def repaint_cached_cells(self, cells):
+        if self.grid_cache is None:
             return
-        painter = QPainter(self)
+        cells = [cell for cell in cells if cell[1] in self.grid_cache_rows]
+        if not cells:
+            return
+        painter = QPainter(self.grid_cache)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setCompositionMode(QPainter.CompositionMode_Clear)
+        for col, row in cells:
+            painter.fillRect(self.cell_rect(col, row), Qt.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        self.paint_cells(painter, cells)
+        painter.end()
+        for col, row in cells:
+            self.update(self.cell_update_rect(col, row))
+
+    def hidpi_pixmap(self, width, height):
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap((QSizeF(width, height) * ratio).toSize())
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+
+    def pixmap_source_rect(self, pixmap, rect):
+        ratio = pixmap.devicePixelRatio()
+        return QRectF(
+            rect.x() * ratio,
+            rect.y() * ratio,
+            rect.width() * ratio,
+            rect.height() * ratio,
+        )
+
+    def pixmap_is_current(self, pixmap, size):
+        return (
+            pixmap is not None
+            and pixmap.devicePixelRatio() == self.devicePixelRatioF()
+            and pixmap.deviceIndependentSize().toSize() == size
+        )
+
+    def render_grid_cache(self):
+        self.grid_cache = self.hidpi_pixmap(self.width(), self.height())
+        self.grid_cache_rows = set()
+        painter = QPainter(self.grid_cache)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        self.paint_labels(painter)
+        painter.end()
+
+    def render_cache_rows(self, rect):
+        rows = [row for row in self.rows_in_rect(rect) if row not in self.grid_cache_rows]
+        if not rows:
+            return
+        painter = QPainter(self.grid_cache)
         painter.setRenderHint(QPainter.Antialiasing, False)
+        self.paint_cell_rows(painter, rows)
+        painter.end()
+        self.grid_cache_rows.update(rows)
+
+    def invalidate_geometry(self):
+        self.cell_rect_rows = None
+        self.border_tile = None
+        self.label_layout = None
+        self.invalidate_periods()
+        self.invalidate_life_image()
+        self.invalidate_grid_cache()
+
+    def invalidate_life_image(self):
+        self.life_image = None
+        self.life_pixmap = None
+        if self.view_mode == "life":
+            self.update()
+
+    def life_year_starts(self):
+        return self.period_starts("years")
+
+    def life_cell_for_day(self, julian_day):
+        starts = self.life_year_starts()
+        if julian_day < starts[0] or julian_day >= starts[-1]:
+            return None
+        row = bisect_right(starts, julian_day) - 1
+        return julian_day - starts[row], row
+
+    def life_cell(self, date_value):
+        if date_value is None or not date_value.isValid():
+            return None
+        return self.life_cell_for_day(date_value.toJulianDay())
+
+    def life_block_rect(self, col, row):
+        return QRect(
+            self.left_gutter + col * self.life_block_width,
+            self.top_gutter + row * self.life_block_height,
+            self.life_block_width,
+            self.life_block_height,
+        )
+
+    def life_update_rect(self, col, row):
+        return self.life_block_rect(col, row).adjusted(-2, -2, 2, 2)
+
+    def life_day_at(self, pos):
+        x = pos.x() - self.left_gutter
+        y = pos.y() - self.top_gutter
+        if x < 0 or y < 0:
+            return None
+        col = int(x // self.life_block_width)
+        row = int(y // self.life_block_height)
+        if col >= self.life_columns or row >= self.years:
+            return None
+        starts = self.life_year_starts()
+        julian_day = starts[row] + col
+        if julian_day >= starts[row + 1]:
+            return None
+        return QDate.fromJulianDay(julian_day)
+
+    def life_pixel(self, julian_day, today_day):
+        if julian_day > today_day:
+            return 0
+        count = self.day_counts.get(julian_day, 0)
+        if count <= 0:
+            return 1
+        return 1 + min(count, 254)
+
+    def life_palette(self):
+        clear = QColor(Qt.transparent).rgba()
+        if self.entries_mode and self.heatmap_colors:
+            empty_color = QColor(self.color_grid)
+            empty_color.setAlpha(28)
+            empty = empty_color.rgba()
+            last = len(self.heatmap_colors) - 1
+            tones = [
+                self.heatmap_colors[min(count, last)].rgba()
+                for count in range(1, 255)
+            ]
+        else:
+            empty = self.color_lived.rgba()
+            tones = [empty] * 254
+        return [clear, empty] + tones
+
+    def apply_life_palette(self):
+        if self.life_image is None:
+            return
+        self.life_image.setColorTable(self.life_palette())
+        self.life_pixmap = None
+        self.update()
+
+    def render_life_image(self):
+        starts = self.life_year_starts()
+        today_day = self.today.toJulianDay()
+        image = QImage(self.life_columns, self.years, QImage.Format_Indexed8)
+        image.setColorTable(self.life_palette())
+        stride = image.bytesPerLine()
+        pixels = bytearray(stride * self.years)
+        for row in range(self.years):
+            lived = min(starts[row + 1], today_day + 1) - starts[row]
+            if lived <= 0:
+                break
+            offset = row * stride
+            pixels[offset:offset + lived] = b"\x01" * lived
+        for julian_day, count in self.day_counts.items():
+            if count <= 0 or julian_day > today_day:
+                continue
+            cell = self.life_cell_for_day(julian_day)
+            if cell is not None:
+                pixels[cell[1] * stride + cell[0]] = 1 + min(count, 254)
+        image.bits()[:] = pixels
+        self.life_image = image
+        self.life_pixmap = None
+
+    def render_life_pixmap(self):
+        if self.life_image is None:
+            self.render_life_image()
+        ratio = self.devicePixelRatioF()
+        size = QSizeF(
+            self.life_columns * self.life_block_width,
+            self.years * self.life_block_height,
+        )
+        self.life_pixmap = QPixmap.fromImage(
+            self.life_image.scaled((size * ratio).toSize())
+        )
+        self.life_pixmap.setDevicePixelRatio(ratio)
+
+    def life_pixmap_size(self):
+        return QSize(
+            self.life_columns * self.life_block_width,
+            self.years * self.life_block_height,
+        )
+
+    def update_life_pixels(self, previous):
+        if self.life_image is None:
+            return
+        changed = [
+            julian_day
+            for julian_day in previous.keys() | self.day_counts.keys()
+            if previous.get(julian_day) != self.day_counts.get(julian_day)
+        ]
+        if len(changed) > self.max_incremental_cells:
+            self.invalidate_life_image()
+            return
+        today_day = self.today.toJulianDay()
+        painter = None
+        if self.life_pixmap is not None:
+            painter = QPainter(self.life_pixmap)
+            painter.setCompositionMode(QPainter.CompositionMode_Source)
+        for julian_day in changed:
+            cell = self.life_cell_for_day(julian_day)
+            if cell is None:
+                continue
+            pixel = self.life_pixel(julian_day, today_day)
+            self.life_image.setPixel(cell[0], cell[1], pixel)
+            block = self.life_block_rect(*cell)
+            if painter is not None:
+                painter.fillRect(
+                    block.translated(-self.left_gutter, -self.top_gutter),
+                    QColor.fromRgba(self.life_image.color(pixel)),
+                )
+            self.update(block)
+        if painter is not None:
+            painter.end()
+
+    def paint_life_image(self, painter, exposed):
+        size = self.life_pixmap_size()
+        if not self.pixmap_is_current(self.life_pixmap, size):
+            self.render_life_pixmap()
+        target = exposed.intersected(
+            QRect(self.left_gutter, self.top_gutter, size.width(), size.height())
+        )
+        if target.isEmpty():
+            return
+        painter.drawPixmap(
+            QRectF(target),
+            self.life_pixmap,
+            self.pixmap_source_rect(
+                self.life_pixmap,
+                target.translated(-self.left_gutter, -self.top_gutter),
+            ),
+        )
+
+    def paint_life_highlight(self, painter, cell, name):
+        rect = self.life_block_rect(*cell).adjusted(-1, -1, 0, 0)
+        painter.setPen(self.cached_paint_resources()["highlights"][name][1])
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(rect)
 
-        grid_pen = QPen(self.color_grid, 1)
-        current_pen = QPen(self.color_current, 1)
-        selected_pen = QPen(self.color_selected, 1)
-        current_glow_pen = QPen(self.color_current, 2)
-        selected_glow_pen = QPen(self.color_selected, 2)
-        grid_pen.setCosmetic(True)
-        current_pen.setCosmetic(True)
-        selected_pen.setCosmetic(True)
-        current_glow_pen.setCosmetic(True)
-        selected_glow_pen.setCosmetic(True)
+    def grid_columns(self):
+        if self.view_mode == "days":
+            return self.day_cols
+        if self.view_mode == "years":
+            return self.years_per_row
+        if self.view_mode == "months":
+            return 12
+        return self.weeks_per_year
+
+    def cached_cell_rects(self):
+        if self.cell_rect_rows is None:
+            pitch = self.cell + self.gap
+            self.cell_rect_rows = [
+                [
+                    QRectF(
+                        self.left_gutter + col * pitch,
+                        self.top_gutter + row * pitch,
+                        self.cell,
+                        self.cell,
+                    )
+                    for col in range(self.grid_columns())
+                ]
+                for row in range(self.grid_rows())
+            ]
+        return self.cell_rect_rows
+
+    def cached_border_tile(self):
+        if self.border_tile is None:
+            pitch = self.cell + self.gap
+            self.border_tile = self.hidpi_pixmap(pitch, pitch)
+            painter = QPainter(self.border_tile)
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            painter.setPen(self.cached_paint_resources()["grid_pen"])
+            painter.drawRect(QRectF(0.5, 0.5, self.cell - 1, self.cell - 1))
+            painter.end()
+        return self.border_tile
+
+    def paint_cell_rows(self, painter, rows):
+        rects = self.cached_cell_rects()
+        buckets = {}
+        if self.view_mode == "days":
+            start_day = self.daily_start_date().toJulianDay()
+            for row in rows:
+                for col in range(self.day_cols):
+                    color = self.day_cell_color(start_day + col * 7 + row)
+                    self.add_fill(buckets, color, rects[row][col])
+        elif self.is_period_mode():
+            periods_lived = self.periods_lived()
+            columns = self.grid_columns()
+            for row in rows:
+                for col in range(self.row_cell_count(row)):
+                    color = self.period_cell_color(row * columns + col, periods_lived)
+                    self.add_fill(buckets, color, rects[row][col])
+        elif self.entries_mode and self.heatmap_colors:
+            row_set = set(rows)
+            for index, count in self.week_counts.items():
+                row = index // self.weeks_per_year
+                if count > 0 and row in row_set:
+                    col = index % self.weeks_per_year
+                    self.add_fill(buckets, self.heatmap_tone(count), rects[row][col])
+        else:
+            weeks_lived = self.weeks_lived()
+            lived_rects = []
+            for row in rows:
+                lived = weeks_lived - row * self.weeks_per_year
+                if lived <= 0:
+                    continue
+                lived_rects.extend(rects[row][:lived])
+                if lived < self.weeks_per_year:
+                    self.add_fill(buckets, self.color_future, rects[row][lived])
+            if lived_rects:
+                buckets[self.color_lived.rgba()] = (self.color_lived, lived_rects)
+        self.draw_fills(painter, buckets)
+
+        if not self.devicePixelRatioF().is_integer():
+            painter.setPen(self.cached_paint_resources()["grid_pen"])
+            painter.drawRects(
+                [
+                    rects[row][col].adjusted(0.5, 0.5, -0.5, -0.5)
+                    for row in rows
+                    for col in range(self.row_cell_count(row))
+                ]
+            )
+            return
+        pitch = self.cell + self.gap
+        tile = self.cached_border_tile()
+        for first, last in self.row_runs(rows):
+            while first <= last:
+                run_end = first
+                columns = self.row_cell_count(first)
+                while run_end < last and self.row_cell_count(run_end + 1) == columns:
+                    run_end += 1
+                painter.drawTiledPixmap(
+                    QRectF(
+                        self.left_gutter,
+                        self.top_gutter + first * pitch,
+                        columns * pitch,
+                        (run_end - first + 1) * pitch,
+                    ),
+                    tile,
+                )
+                first = run_end + 1
+
+    def row_runs(self, rows):
+        runs = []
+        for row in sorted(rows):
+            if runs and row == runs[-1][1] + 1:
+                runs[-1][1] = row
+            else:
+                runs.append([row, row])
+        return runs
 
+    def paint_cells(self, painter, cells):
+        rects = self.cached_cell_rects()
         weeks_lived = self.weeks_lived()
+        start_day = self.daily_start_date().toJulianDay()
+        periods_lived = self.periods_lived() if self.is_period_mode() else 0
+        buckets = {}
+        border_rects = []
+        for col, row in cells:
+            rect = rects[row][col]
+            if self.is_period_mode():
+                color = self.period_cell_color(
+                    row * self.grid_columns() + col, periods_lived
+                )
+            elif self.view_mode == "days":
+                color = self.day_cell_color(start_day + col * 7 + row)
+            else:
+                color = self.week_cell_color(
+                    row * self.weeks_per_year + col, weeks_lived
+                )
+            self.add_fill(buckets, color, rect)
+            border_rects.append(rect.adjusted(0.5, 0.5, -0.5, -0.5))
+        self.draw_fills(painter, buckets)
+        painter.setPen(self.cached_paint_resources()["grid_pen"])
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRects(border_rects)
+
+    def add_fill(self, buckets, color, rect):
+        if color is None:
+            return
+        buckets.setdefault(color.rgba(), (color, []))[1].append(rect)
 
-        label_font = QFont("Segoe UI", 8, QFont.DemiBold)
-        painter.setFont(label_font)
-        painter.setPen(QPen(self.color_grid, 1))
+    def draw_fills(self, painter, buckets):
+        painter.setPen(Qt.NoPen)
+        for color, rects in buckets.values():
+            painter.setBrush(color)
+            painter.drawRects(rects)
+        painter.setBrush(Qt.NoBrush)
 
-        month_font = QFont("Segoe UI", 7, QFont.DemiBold)
-        painter.setFont(month_font)
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.pixmap_is_current(self.grid_cache, self.size()):
+            self.render_grid_cache()
+        exposed = event.rect()
+        if self.view_mode != "life":
+            self.render_cache_rows(exposed)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.drawPixmap(
+            QRectF(exposed),
+            self.grid_cache,
+            self.pixmap_source_rect(self.grid_cache, exposed),
+        )
+        if self.view_mode == "life":
+            self.paint_life_image(painter, exposed)
+            for date_value, name in (
+                (self.today, "current"),
+                (self.selected_date, "selected"),
+            ):
+                cell = self.life_cell(date_value)
+                if cell is not None and self.life_update_rect(*cell).intersects(exposed):
+                    self.paint_life_highlight(painter, cell, name)
+            return
+        if self.is_period_mode():
+            current_cell = self.period_cell_for_date(self.today)
+            selected_cell = self.period_cell_for_date(self.selected_period_date())
+        elif self.view_mode == "days":
+            current_cell = self.day_cell(self.today)
+            selected_cell = self.day_cell(self.selected_date)
+        else:
+            current_cell = self.week_cell(self.weeks_lived())
+            selected_cell = self.week_cell(self.selected_week)
+        for cell, name in ((current_cell, "current"), (selected_cell, "selected")):
+            if cell is None:
+                continue
+            if not self.cell_update_rect(*cell).intersects(exposed):
+                continue
+            self.paint_highlight(painter, self.cell_rect(*cell), name)
+
+    def paint_highlight(self, painter, rect, name):
+        fill, pen, glow_pen = self.cached_paint_resources()["highlights"][name]
+        border_rect = QRectF(
+            rect.x() + 0.5, rect.y() + 0.5, self.cell - 1, self.cell - 1
+        )
+        painter.fillRect(rect.adjusted(1, 1, -1, -1), fill)
+        painter.setPen(pen)
+        painter.drawRect(border_rect.adjusted(1, 1, -1, -1))
+        painter.setPen(glow_pen)
+        painter.drawRect(border_rect.adjusted(2, 2, -2, -2))
+
+    def cached_paint_resources(self):
+        if self.paint_resources is None:
+            grid_pen = QPen(self.color_grid, 1)
+            grid_pen.setCosmetic(True)
+            highlights = {}
+            for name, color, alpha in (
+                ("current", self.color_current, 40),
+                ("selected", self.color_selected, 30),
+            ):
+                pen = QPen(color, 1)
+                glow_pen = QPen(color, 2)
+                pen.setCosmetic(True)
+                glow_pen.setCosmetic(True)
+                fill = QColor(color.red(), color.green(), color.blue(), alpha)
+                highlights[name] = (fill, pen, glow_pen)
+            self.paint_resources = {
+                "grid_pen": grid_pen,
+                "label_pen": QPen(self.color_grid, 1),
+                "fonts": {
+                    "label": QFont("Segoe UI", 8, QFont.DemiBold),
+                    "month": QFont("Segoe UI", 7, QFont.DemiBold),
+                },
+                "highlights": highlights,
+            }
+        return self.paint_resources
+
+    def cached_label_layout(self):
+        if self.label_layout is None:
+            fonts = self.cached_paint_resources()["fonts"]
+            if self.view_mode == "life":
+                labels = self.life_labels()
+            elif self.is_period_mode():
+                labels = self.period_labels()
+            elif self.view_mode == "days":
+                labels = self.daily_labels()
+            else:
+                labels = self.weeks_labels()
+            self.label_layout = {}
+            for font_name, x, baseline, text in labels:
+                ascent = QFontMetricsF(fonts[font_name]).ascent()
+                static_text = QStaticText(text)
+                static_text.setTextFormat(Qt.PlainText)
+                self.label_layout.setdefault(font_name, []).append(
+                    (QPointF(x, baseline - ascent), static_text)
+                )
+        return self.label_layout
+
+    def paint_labels(self, painter):
+        resources = self.cached_paint_resources()
+        painter.setPen(resources["label_pen"])
+        for font_name, labels in self.cached_label_layout().items():
+            painter.setFont(resources["fonts"][font_name])
+            for position, static_text in labels:
+                painter.drawStaticText(position, static_text)
+
+    def weeks_labels(self):
+        labels = []
         last_month = None
         for col in range(self.weeks_per_year):
             date_value = self.birth_date.addDays(col * 7)
             month = date_value.month()
             if last_month is None or month != last_month:
                 x = self.left_gutter + col * (self.cell + self.gap)
-                painter.drawText(x, 12, date_value.toString("MMM"))
+                labels.append(("month", x, 12, date_value.toString("MMM")))
                 last_month = month
 
-        painter.setFont(label_font)
         for year in range(0, self.years, 5):
             y = self.top_gutter + year * (self.cell + self.gap)
-            painter.drawText(2, y + self.cell, f"{year:02d}")
-
-        for row in range(self.years):
-            for col in range(self.weeks_per_year):
-                index = row * self.weeks_per_year + col
-                x = self.left_gutter + col * (self.cell + self.gap)
-                y = self.top_gutter + row * (self.cell + self.gap)
-                rect = QRectF(x, y, self.cell, self.cell)
-                border_rect = QRectF(x + 0.5, y + 0.5, self.cell - 1, self.cell - 1)
-
-                count = self.week_counts.get(index, 0)
-                if self.entries_mode and self.heatmap_colors:
-                    if count > 0:
-                        tone_index = min(count, len(self.heatmap_colors) - 1)
-                        painter.fillRect(rect, self.heatmap_colors[tone_index])
-                    painter.setPen(grid_pen)
-                    painter.drawRect(border_rect)
-                else:
-                    if index < weeks_lived:
-                        painter.fillRect(rect, self.color_lived)
-                        painter.setPen(grid_pen)
-                        painter.drawRect(border_rect)
-                    elif index == weeks_lived:
-                        painter.fillRect(rect, self.color_future)
-                        painter.setPen(grid_pen)
-                        painter.drawRect(border_rect)
-                    else:
-                        painter.setPen(grid_pen)
-                        painter.drawRect(border_rect)
-                if index == weeks_lived:
-                    painter.fillRect(
-                        rect.adjusted(1, 1, -1, -1),
-                        QColor(self.color_current.red(), self.color_current.green(), self.color_current.blue(), 40),
-                    )
-                    painter.setPen(current_pen)
-                    painter.drawRect(border_rect.adjusted(1, 1, -1, -1))
-                    painter.setPen(current_glow_pen)
-                    painter.drawRect(border_rect.adjusted(2, 2, -2, -2))
-                    painter.setPen(grid_pen)
-                if self.selected_week == index:
-                    painter.fillRect(
-                        rect.adjusted(1, 1, -1, -1),
-                        QColor(self.color_selected.red(), self.color_selected.green(), self.color_selected.blue(), 30),
-                    )
-                    painter.setPen(selected_pen)
-                    painter.drawRect(border_rect.adjusted(1, 1, -1, -1))
-                    painter.setPen(selected_glow_pen)
-                    painter.drawRect(border_rect.adjusted(2, 2, -2, -2))
-                    painter.setPen(grid_pen)
-
-    def paint_daily(self):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, False)
-
-        grid_pen = QPen(self.color_grid, 1)
-        current_pen = QPen(self.color_current, 1)
-        selected_pen = QPen(self.color_selected, 1)
-        current_glow_pen = QPen(self.color_current, 2)
-        selected_glow_pen = QPen(self.color_selected, 2)
-        grid_pen.setCosmetic(True)
-        current_pen.setCosmetic(True)
-        selected_pen.setCosmetic(True)
-        current_glow_pen.setCosmetic(True)
-        selected_glow_pen.setCosmetic(True)
-
+            labels.append(("label", 2, y + self.cell, f"{year:02d}"))
+        return labels
+
+    def week_cell_color(self, index, weeks_lived):
+        if self.entries_mode and self.heatmap_colors:
+            return self.heatmap_tone(self.week_counts.get(index, 0))
+        if index < weeks_lived:
+            return self.color_lived
+        if index == weeks_lived:
+            return self.color_future
+        return None
+
+    def daily_labels(self):
         start_date = self.daily_start_date()
-        month_font = QFont("Segoe UI", 7, QFont.DemiBold)
-        painter.setFont(month_font)
-        painter.setPen(QPen(self.color_grid, 1))
-
+        labels = []
         last_month = None
         for col in range(self.day_cols):
             date_value = start_date.addDays(col * 7)
             month = date_value.month()
             if last_month is None or month != last_month:
                 x = self.left_gutter + col * (self.cell + self.gap)
-                painter.drawText(x, 12, date_value.toString("MMM"))
+                labels.append(("month", x, 12, date_value.toString("MMM")))
                 last_month = month
 
         day_labels = {1: "Mon", 3: "Wed", 5: "Fri"}
@@ -435,45 +1287,50 @@ class LifeWeeksWidget(QWidget):
             label = day_labels.get(day_of_week)
             if label:
                 y = self.top_gutter + row * (self.cell + self.gap)
-                painter.drawText(6, y + self.cell, label)
+                labels.append(("month", 6, y + self.cell, label))
+        return labels
+
+    def period_labels(self):
+        pitch = self.cell + self.gap
+        labels = []
+        if self.view_mode == "months":
+            for col in range(0, 12, 3):
+                date_value = self.birth_date.addMonths(col)
+                x = self.left_gutter + col * pitch
+                labels.append(("month", x, 12, date_value.toString("MMM")))
+        else:
+            for col in range(self.years_per_row):
+                x = self.left_gutter + col * pitch + 2
+                labels.append(("month", x, 12, str(col)))
+
+        step = 1 if self.view_mode == "years" else 5
+        for row in range(0, self.grid_rows(), step):
+            y = self.top_gutter + row * pitch
+            year = row * self.years_per_row if self.view_mode == "years" else row
+            labels.append(("label", 2, y + self.cell, f"{year:02d}"))
+        return labels
+
+    def life_labels(self):
+        labels = []
+        for month in range(0, 12, 2):
+            date_value = self.birth_date.addMonths(month)
+            x = self.left_gutter + self.birth_date.daysTo(date_value) * self.life_block_width
+            labels.append(("month", x, 12, date_value.toString("MMM")))
 
-        for col in range(self.day_cols):
-            for row in range(self.day_rows):
-                date_value = start_date.addDays(col * 7 + row)
-                key = date_value.toString("yyyy-MM-dd")
-                count = self.day_counts.get(key, 0)
-                x = self.left_gutter + col * (self.cell + self.gap)
-                y = self.top_gutter + row * (self.cell + self.gap)
-                rect = QRectF(x, y, self.cell, self.cell)
-                border_rect = QRectF(x + 0.5, y + 0.5, self.cell - 1, self.cell - 1)
-
-                if self.entries_mode and self.heatmap_colors and count > 0:
-                    tone_index = min(count, len(self.heatmap_colors) - 1)
-                    painter.fillRect(rect, self.heatmap_colors[tone_index])
-                painter.setPen(grid_pen)
-                painter.drawRect(border_rect)
-
-                if date_value == self.today:
-                    painter.fillRect(
-                        rect.adjusted(1, 1, -1, -1),
-                        QColor(self.color_current.red(), self.color_current.green(), self.color_current.blue(), 40),
-                    )
-                    painter.setPen(current_pen)
-                    painter.drawRect(border_rect.adjusted(1, 1, -1, -1))
-                    painter.setPen(current_glow_pen)
-                    painter.drawRect(border_rect.adjusted(2, 2, -2, -2))
-                    painter.setPen(grid_pen)
-
-                if self.selected_date is not None and date_value == self.selected_date:
-                    painter.fillRect(
-                        rect.adjusted(1, 1, -1, -1),
-                        QColor(self.color_selected.red(), self.color_selected.green(), self.color_selected.blue(), 30),
-                    )
-                    painter.setPen(selected_pen)
-                    painter.drawRect(border_rect.adjusted(1, 1, -1, -1))
-                    painter.setPen(selected_glow_pen)
-                    painter.drawRect(border_rect.adjusted(2, 2, -2, -2))
-                    painter.setPen(grid_pen)
+        for year in range(0, self.years, 5):
+            y = self.top_gutter + year * self.life_block_height
+            labels.append(("label", 2, y + 10, f"{year:02d}"))
+        return labels
+
+    def day_cell_color(self, julian_day):
+        if not self.entries_mode or not self.heatmap_colors:
+            return None
+        return self.heatmap_tone(self.day_counts.get(julian_day, 0))
+
+    def heatmap_tone(self, count):
+        if count <= 0:
+            return None
+        return self.heatmap_colors[min(count, len(self.heatmap_colors) - 1)]
 
 
 class LegendItem(QFrame):
@@ -511,6 +1368,7 @@ class NoteItemWidget(QFrame):
         has_children=False,
         collapsed=False,
         entry_id=None,
+        title_emoji=None,
     ):
         super().__init__(parent)
         self.setObjectName("noteItem")
@@ -566,7 +1424,10 @@ class NoteItemWidget(QFrame):
 
         text_box = QVBoxLayout()
         text_box.setSpacing(2)
-        emoji, clean_title = self.split_title_emoji(title)
+        if title_emoji is None:
+            emoji, clean_title = self.split_title_emoji(title)
+        else:
+            emoji, clean_title = title_emoji, title
         title_row = QHBoxLayout()
         title_row.setContentsMargins(0, 0, 0, 0)
         title_row.setSpacing(6)
@@ -591,13 +1452,7 @@ class NoteItemWidget(QFrame):
         layout.addLayout(text_box, 1)
 
     def split_title_emoji(self, title):
-        if not title:
-            return "", ""
-        value = title.strip()
-        if len(value) >= 2 and value[1] == " ":
-            emoji = value[0]
-            return emoji, value[2:].lstrip()
-        return "", value
+        return split_title_emoji(title)
 
     def paintEvent(self, event):
         super().paintEvent(event)